@@ -3,6 +3,8 @@
 
 import sys
 import shutil
+from functools import lru_cache
+from importlib.util import find_spec
 from pathlib import Path
 
 
@@ -30,59 +32,66 @@ def check_imports() -> None:
     ]
     
     failed_imports = []
+    # Collected and written in one go so piped CI logs get a single write
+    lines: list[str] = []
     
-    # Check pydub separately due to Python 3.13 compatibility issues
-    try:
-        import pydub
-        print("✅ pydub")
-    except ImportError as e:
-        if "pyaudioop" in str(e):
-            print("⚠️  pydub - MP3 export disabled (Python 3.13 compatibility)")
-        else:
-            print("❌ pydub - not installed")
-            failed_imports.append("pydub")
+    # Check pydub separately due to Python 3.13 compatibility issues: it needs
+    # `audioop` (removed from the stdlib in 3.13) or the `pyaudioop` fallback.
+    if find_spec("pydub") is None:
+        lines.append("❌ pydub - not installed")
+        failed_imports.append("pydub")
+    elif find_spec("audioop") is None and find_spec("pyaudioop") is None:
+        lines.append("⚠️  pydub - MP3 export disabled (Python 3.13 compatibility)")
+    else:
+        lines.append("✅ pydub")
     
-    # Check core packages
+    # Check core packages (find_spec locates them without running their imports)
     for package_name, import_name in required_packages:
-        try:
-            __import__(import_name)
-            print(f"✅ {package_name}")
-        except ImportError:
-            print(f"❌ {package_name} - not installed")
+        if find_spec(import_name) is not None:
+            lines.append(f"✅ {package_name}")
+        else:
+            lines.append(f"❌ {package_name} - not installed")
             failed_imports.append(package_name)
     
     # Check optional packages
-    print("\n📦 Optional packages:")
+    lines.append("\n📦 Optional packages:")
     
     # Check Coqui TTS
-    try:
-        import TTS
+    if find_spec("TTS") is not None:
         if sys.version_info >= (3, 13):
-            print("⚠️  coqui-tts - available but not supported on Python 3.13+")
+            lines.append("⚠️  coqui-tts - available but not supported on Python 3.13+")
         else:
-            print("✅ coqui-tts")
-    except ImportError:
+            lines.append("✅ coqui-tts")
+    else:
         if sys.version_info >= (3, 13):
-            print("⚠️  coqui-tts - optional and not supported on Python 3.13+")
+            lines.append("⚠️  coqui-tts - optional and not supported on Python 3.13+")
         else:
-            print("⚠️  coqui-tts - optional (not installed)")
+            lines.append("⚠️  coqui-tts - optional (not installed)")
     
     # Check OpenAI
-    try:
-        import openai
-        print("✅ openai")
-    except ImportError:
-        print("⚠️  openai - optional (not installed)")
+    if find_spec("openai") is not None:
+        lines.append("✅ openai")
+    else:
+        lines.append("⚠️  openai - optional (not installed)")
     
     if failed_imports:
-        print(f"\n❌ Missing core packages: {', '.join(failed_imports)}")
-        print("Run: pip install -r requirements.txt")
+        lines.append(f"\n❌ Missing core packages: {', '.join(failed_imports)}")
+        lines.append("Run: pip install -r requirements.txt")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+    if failed_imports:
         sys.exit(1)
 
 
+@lru_cache(maxsize=1)
+def _ffmpeg_path():
+    """Locate ffmpeg once; repeated checks reuse the PATH scan."""
+    return shutil.which("ffmpeg")
+
+
 def check_ffmpeg() -> None:
     """Check ffmpeg availability."""
-    ffmpeg_path = shutil.which("ffmpeg")
+    ffmpeg_path = _ffmpeg_path()
     if ffmpeg_path:
         print(f"✅ ffmpeg found at: {ffmpeg_path}")
     else:
@@ -6,10 +6,15 @@ Provides a clean interface for text-to-speech synthesis with multiple engines,
 compare mode, and downloadable audio files.
 """
 
+from __future__ import annotations
+
+import io
 import os
 import sys
-import tempfile
-import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Optional, Tuple, TYPE_CHECKING
 
@@ -17,68 +22,134 @@ from typing import Optional, Tuple, TYPE_CHECKING
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import streamlit as st
-import numpy as np
-
-from src.tts_service import get_tts
-from src.audio_utils import save_wav, save_mp3, plot_waveform, PYDUB_AVAILABLE
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
+# Heavy modules (numpy, engine SDKs, matplotlib, pydub) are imported inside the
+# functions that need them so the UI renders before they finish loading.
 if TYPE_CHECKING:
-    from src.tts_service import TTSEngine
+    import numpy as np
+
+
+# UI mappings, built once per process rather than on every rerun
+_ENGINE_MAP = {
+    "gTTS (default)": "gtts",
+    "OpenAI (API)": "openai",
+    "Coqui (local)": "coqui",
+}
+
+_LANG_MAP = {
+    "English (US)": "en",
+    "English (UK)": "en",  # Note: gTTS doesn't support UK accent
+    "Turkish": "tr",
+}
+
+_EXAMPLES = {
+    "English (US)": "Hello! This is a test of the text-to-speech system. How does it sound?",
+    "English (UK)": "Hello! This is a test of the text-to-speech system. How does it sound?",
+    "Turkish": "Merhaba! Bu metin-konuşma sisteminin bir testidir. Nasıl ses veriyor?"
+}
 
 
 # UI Mapping Functions
 def _map_ui_engine_to_code(label: str) -> str:
     """Map UI engine labels to internal engine codes."""
-    mapping = {
-        "gTTS (default)": "gtts",
-        "OpenAI (API)": "openai",
-        "Coqui (local)": "coqui",
-    }
-    return mapping.get(label, "gtts")
+    return _ENGINE_MAP.get(label, "gtts")
 
 
 def _map_ui_language_to_code(label: str) -> str:
     """Map UI language labels to internal language codes."""
-    mapping = {
-        "English (US)": "en",
-        "English (UK)": "en",  # Note: gTTS doesn't support UK accent
-        "Turkish": "tr",
-    }
-    return mapping.get(label, "en")
+    return _LANG_MAP.get(label, "en")
 
 
+@st.cache_resource(show_spinner=False)
 def _get_available_engines() -> list[str]:
-    """Get list of available engines based on current environment."""
+    """Get list of available engines based on current environment.
+
+    Cached for the process: Streamlit reruns the script on every widget change,
+    and ``find_spec`` only locates the packages without executing them.
+    """
     engines = ["gTTS (default)"]
     
     # Check if OpenAI is available
-    try:
-        import openai
-        if os.getenv("OPENAI_API_KEY"):
-            engines.append("OpenAI (API)")
-    except ImportError:
-        pass
+    if find_spec("openai") is not None and os.getenv("OPENAI_API_KEY"):
+        engines.append("OpenAI (API)")
     
     # Check if Coqui is available (and Python version compatible)
-    try:
-        import sys
-        if sys.version_info < (3, 13):
-            import TTS
-            engines.append("Coqui (local)")
-    except ImportError:
-        pass
+    if sys.version_info < (3, 13) and find_spec("TTS") is not None:
+        engines.append("Coqui (local)")
     
     return engines
 
 
+@st.cache_resource(show_spinner=False)
+def _get_service(engine_code: str, lang_code: str):
+    """Return the TTS service for (engine, language), built once per process.
+
+    Loaded models and API clients are shared inside `src.tts_service`; this
+    only saves re-creating the service object on every rerun.
+    """
+    from src.tts_service import get_tts
+
+    return get_tts(engine=engine_code, default_lang=lang_code)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_synth(
+    engine_code: str,
+    text: str,
+    lang_code: str,
+    speed: float,
+    pitch: float,
+) -> Tuple[np.ndarray, int]:
+    """Synthesize once per (engine, text, language, speed, pitch).
+
+    Re-clicking Generate or toggling compare mode reuses the previous audio
+    instead of hitting the network (or the OpenAI bill) again. Errors are not
+    cached and propagate to the caller.
+    """
+    svc = _get_service(engine_code, lang_code)
+    return svc.synthesize(text, language=lang_code, speed=speed, pitch=pitch)
+
+
+class _DeferredNotices:
+    """Stand-in for ``st`` that records error/warning/info calls for later.
+
+    Lets a background job report problems without rendering them until the
+    caller decides its output should be shown.
+    """
+
+    __slots__ = ("_calls",)
+
+    def __init__(self) -> None:
+        self._calls: list[tuple[str, str]] = []
+
+    def error(self, body: str) -> None:
+        self._calls.append(("error", body))
+
+    def warning(self, body: str) -> None:
+        self._calls.append(("warning", body))
+
+    def info(self, body: str) -> None:
+        self._calls.append(("info", body))
+
+    def replay(self) -> None:
+        """Render the recorded messages with the real Streamlit calls."""
+        for kind, body in self._calls:
+            getattr(st, kind)(body)
+
+
 def _synthesize_with_engine(
     engine_label: str, 
     text: str, 
     language: str, 
     speed: float = 1.0, 
-    pitch: float = 0.0
+    pitch: float = 0.0,
+    ui=st,
 ) -> Optional[Tuple[np.ndarray, int]]:
-    """Synthesize text with specified engine, handling errors gracefully."""
+    """Synthesize text with specified engine, handling errors gracefully.
+
+    Problems are reported through ``ui`` (``st`` or a `_DeferredNotices`).
+    """
     try:
         engine_code = _map_ui_engine_to_code(engine_label)
         lang_code = _map_ui_language_to_code(language)
@@ -86,68 +157,108 @@ def _synthesize_with_engine(
         if engine_code == "openai":
             api_key = os.getenv("OPENAI_API_KEY")
             if not api_key:
-                st.error("❌ OPENAI_API_KEY environment variable not set")
+                ui.error("❌ OPENAI_API_KEY environment variable not set")
                 return None
             
-            svc = get_tts(engine="openai", default_lang=lang_code)
-            audio, sr = svc.synthesize(text, language=lang_code, speed=speed, pitch=pitch)
-            return audio, sr
+            return _cached_synth("openai", text, lang_code, speed, pitch)
         
         elif engine_code == "coqui":
             try:
-                svc = get_tts(engine="coqui", default_lang=lang_code)
-                audio, sr = svc.synthesize(text, language=lang_code, speed=speed, pitch=pitch)
-                return audio, sr
+                return _cached_synth("coqui", text, lang_code, speed, pitch)
             except RuntimeError as e:
                 if "not supported on Python 3.13" in str(e):
-                    st.warning("⚠️ Coqui TTS is not supported on Python 3.13+. Skipping...")
+                    ui.warning("⚠️ Coqui TTS is not supported on Python 3.13+. Skipping...")
                 else:
-                    st.error(f"❌ Coqui TTS error: {e}")
+                    ui.error(f"❌ Coqui TTS error: {e}")
                 return None
         
         else:  # gTTS
-            svc = get_tts(engine="gtts", default_lang=lang_code)
-            audio, sr = svc.synthesize(text, language=lang_code, speed=speed, pitch=pitch)
-            return audio, sr
+            return _cached_synth("gtts", text, lang_code, speed, pitch)
             
     except Exception as e:
-        st.error(f"❌ Synthesis failed with {engine_label}: {e}")
+        ui.error(f"❌ Synthesis failed with {engine_label}: {e}")
         return None
 
 
-def _create_audio_artifacts(audio: np.ndarray, sr: int, temp_dir: Path) -> dict:
-    """Create audio artifacts (WAV, MP3, waveform) in temp directory."""
-    artifacts = {}
-    
-    # Save WAV
-    wav_path = temp_dir / "audio.wav"
-    save_wav(audio, sr, wav_path)
-    artifacts["wav"] = wav_path
-    
-    # Save MP3 (if available)
-    if PYDUB_AVAILABLE:
-        try:
-            mp3_path = temp_dir / "audio.mp3"
-            save_mp3(audio, sr, mp3_path)
-            artifacts["mp3"] = mp3_path
-        except Exception as e:
-            st.warning(f"⚠️ MP3 export failed: {e}")
-    else:
-        st.info("ℹ️ MP3 export not available (pydub compatibility issue)")
-    
-    # Create waveform
-    png_path = temp_dir / "waveform.png"
-    plot_waveform(audio, sr, png_path)
-    artifacts["waveform"] = png_path
+@dataclass(slots=True)
+class AudioArtifacts:
+    """Encoded outputs for one synthesis result, held in memory for rendering."""
+    wav_bytes: bytes
+    mp3_bytes: Optional[bytes]
+    png_bytes: bytes
+
+
+def _encode_wav(audio: np.ndarray, sr: int) -> bytes:
+    from src.audio_utils import save_wav
+
+    buf = io.BytesIO()
+    save_wav(audio, sr, buf)
+    return buf.getvalue()
+
+
+def _encode_mp3(audio: np.ndarray, sr: int) -> bytes:
+    from src.audio_utils import save_mp3
+
+    buf = io.BytesIO()
+    save_mp3(audio, sr, buf)
+    return buf.getvalue()
+
+
+def _create_audio_artifacts(audio: np.ndarray, sr: int, ui=st) -> AudioArtifacts:
+    """Create audio artifacts (WAV, MP3, waveform) in memory.
+
+    The MP3 encode (an ffmpeg subprocess) and the waveform render run on
+    worker threads while the WAV is written here. Workers never call
+    Streamlit; problems are reported through ``ui`` from this thread.
+    """
+    from src.audio_utils import plot_waveform_bytes, PYDUB_AVAILABLE
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        mp3_future = None
+        if PYDUB_AVAILABLE:
+            mp3_future = pool.submit(_encode_mp3, audio, sr)
+        # Create waveform (kept in memory; st.image takes PNG bytes directly)
+        png_future = pool.submit(plot_waveform_bytes, audio, sr)
+        
+        # Save WAV
+        wav_bytes = _encode_wav(audio, sr)
+        
+        # Save MP3 (if available)
+        mp3_bytes = None
+        if mp3_future is not None:
+            try:
+                mp3_bytes = mp3_future.result()
+            except Exception as e:
+                ui.warning(f"⚠️ MP3 export failed: {e}")
+        else:
+            ui.info("ℹ️ MP3 export not available (pydub compatibility issue)")
+        
+        png_bytes = png_future.result()
     
-    return artifacts
+    return AudioArtifacts(wav_bytes=wav_bytes, mp3_bytes=mp3_bytes, png_bytes=png_bytes)
+
+
+def _generate_result(
+    engine_label: str,
+    text: str,
+    language: str,
+    speed: float,
+    pitch: float,
+    ui=st,
+) -> Optional[Tuple[np.ndarray, int, AudioArtifacts]]:
+    """Synthesize with one engine and build its artifacts; None on failure."""
+    result = _synthesize_with_engine(engine_label, text, language, speed, pitch, ui)
+    if result is None:
+        return None
+    audio, sr = result
+    return audio, sr, _create_audio_artifacts(audio, sr, ui)
 
 
 def _render_result_block(
     engine_label: str, 
     audio: np.ndarray, 
     sr: int, 
-    artifacts: dict,
+    artifacts: AudioArtifacts,
     col: Optional[st.container] = None
 ):
     """Render a single result block with audio player, downloads, and waveform."""
@@ -156,47 +267,32 @@ def _render_result_block(
     container.subheader(f"{engine_label} Result")
     
     # Audio player
-    with open(artifacts["wav"], "rb") as f:
-        container.audio(f.read(), format="audio/wav")
+    container.audio(artifacts.wav_bytes, format="audio/wav")
     
     # Download buttons
     col1, col2 = container.columns(2)
     
     with col1:
-        with open(artifacts["wav"], "rb") as f:
-            st.download_button(
-                label="📥 Download WAV",
-                data=f.read(),
-                file_name="tts_output.wav",
-                mime="audio/wav"
-            )
+        st.download_button(
+            label="📥 Download WAV",
+            data=artifacts.wav_bytes,
+            file_name="tts_output.wav",
+            mime="audio/wav"
+        )
     
     with col2:
-        if "mp3" in artifacts:
-            with open(artifacts["mp3"], "rb") as f:
-                st.download_button(
-                    label="📥 Download MP3",
-                    data=f.read(),
-                    file_name="tts_output.mp3",
-                    mime="audio/mp3"
-                )
+        if artifacts.mp3_bytes is not None:
+            st.download_button(
+                label="📥 Download MP3",
+                data=artifacts.mp3_bytes,
+                file_name="tts_output.mp3",
+                mime="audio/mp3"
+            )
         else:
             st.button("📥 Download MP3", disabled=True, help="MP3 export not available")
     
     # Waveform
-    container.image(artifacts["waveform"], caption="Audio Waveform", use_column_width=True)
-
-
-def _cleanup_temp_files():
-    """Clean up temporary files from session state."""
-    if "temp_dirs" in st.session_state:
-        for temp_dir in st.session_state.temp_dirs:
-            try:
-                import shutil
-                shutil.rmtree(temp_dir, ignore_errors=True)
-            except Exception:
-                pass
-        st.session_state.temp_dirs.clear()
+    container.image(artifacts.png_bytes, caption="Audio Waveform", width="stretch")
 
 
 def main():
@@ -207,13 +303,6 @@ def main():
         layout="wide"
     )
     
-    # Initialize temp file tracking
-    if "temp_dirs" not in st.session_state:
-        st.session_state.temp_dirs = []
-    
-    # Register cleanup on exit
-    atexit.register(_cleanup_temp_files)
-    
     st.title("🎤 Text-to-Speech Mini Assistant")
     st.markdown("Generate speech from text using multiple TTS engines")
     
@@ -268,58 +357,58 @@ def main():
     # Main content area
     st.header("Text Input")
     
-    # Example texts
-    examples = {
-        "English (US)": "Hello! This is a test of the text-to-speech system. How does it sound?",
-        "English (UK)": "Hello! This is a test of the text-to-speech system. How does it sound?",
-        "Turkish": "Merhaba! Bu metin-konuşma sisteminin bir testidir. Nasıl ses veriyor?"
-    }
-    
     # Text input with placeholder
     text = st.text_area(
         "Enter text to synthesize",
-        value=examples.get(language, "Enter your text here..."),
+        value=_EXAMPLES.get(language, "Enter your text here..."),
         height=150,
         help="Enter the text you want to convert to speech"
     )
     
     # Generate button
-    if st.button("🎤 Generate Speech", type="primary", use_container_width=True):
+    if st.button("🎤 Generate Speech", type="primary", width="stretch"):
         if not text.strip():
             st.error("❌ Please enter some text to synthesize")
             return
         
         # Show processing message
         with st.spinner("Generating speech..."):
-            # Create temporary directory for artifacts
-            temp_dir = tempfile.mkdtemp()
-            temp_path = Path(temp_dir)
-            st.session_state.temp_dirs.append(temp_dir)
-            
-            # Generate with primary engine
-            primary_result = _synthesize_with_engine(
-                primary_engine, text, language, speed, pitch
-            )
+            # Synthesize both engines concurrently in compare mode; each job
+            # is network or model bound and they share no mutable state.
+            # The secondary job's messages are held back so nothing of it is
+            # shown when the primary engine fails.
+            secondary_notices = _DeferredNotices()
+            ctx = get_script_run_ctx()
+            with ThreadPoolExecutor(
+                max_workers=2,
+                initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx),
+            ) as pool:
+                primary_future = pool.submit(
+                    _generate_result, primary_engine, text, language, speed, pitch
+                )
+                secondary_future = None
+                if compare_mode and secondary_engine:
+                    secondary_future = pool.submit(
+                        _generate_result,
+                        secondary_engine, text, language, speed, pitch, secondary_notices,
+                    )
+                primary_result = primary_future.result()
+                secondary_result = secondary_future.result() if secondary_future else None
                 
             if primary_result is None:
                 st.error("❌ Primary engine failed to generate speech")
                 return
             
-            primary_audio, primary_sr = primary_result
-            primary_artifacts = _create_audio_artifacts(primary_audio, primary_sr, temp_path)
+            primary_audio, primary_sr, primary_artifacts = primary_result
             
             # Handle compare mode
             if compare_mode and secondary_engine:
-                secondary_result = _synthesize_with_engine(
-                    secondary_engine, text, language, speed, pitch
-                )
-                
+                secondary_notices.replay()
                 if secondary_result is None:
                     st.warning("⚠️ Secondary engine failed, showing primary result only")
                     compare_mode = False
                 else:
-                    secondary_audio, secondary_sr = secondary_result
-                    secondary_artifacts = _create_audio_artifacts(secondary_audio, secondary_sr, temp_path)
+                    secondary_audio, secondary_sr, secondary_artifacts = secondary_result
             
             # Display results
             st.success("✅ Speech generated successfully!")
@@ -1,19 +1,36 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple
-import tempfile
+from typing import BinaryIO, Optional, Tuple, Union
+import io
+import shutil
+import wave
 
 import numpy as np
-import soundfile as sf
-import matplotlib.pyplot as plt
 
-# Try to import pydub, but handle Python 3.13 compatibility issues
-try:
-    from pydub import AudioSegment
-    PYDUB_AVAILABLE = True
-except ImportError:
-    PYDUB_AVAILABLE = False
+
+def __getattr__(name: str):
+    """Resolve ``PYDUB_AVAILABLE`` lazily so importing this module skips pydub.
+
+    pydub may fail to import on Python 3.13 (missing ``audioop``); the probe
+    runs once on first access and the result is cached as a module global.
+    """
+    if name == "PYDUB_AVAILABLE":
+        try:
+            import pydub  # noqa: F401
+            available = True
+        except ImportError:
+            available = False
+        globals()["PYDUB_AVAILABLE"] = available
+        return available
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=1)
+def _ffmpeg_path() -> Optional[str]:
+    """Locate ffmpeg once per process; PATH is not rescanned on every export."""
+    return shutil.which("ffmpeg")
 
 
 def _ensure_parent_dir(path: Path) -> None:
@@ -35,8 +52,18 @@ def _validate_audio_input(audio: np.ndarray, sample_rate: int) -> None:
         raise ValueError(f"'sample_rate' must be a positive integer, got {sample_rate}")
 
 
-def save_wav(audio: np.ndarray, sample_rate: int, out_path: Path) -> Path:
-    """Save mono float32 audio to a WAV file.
+def _to_pcm16(audio: np.ndarray) -> bytes:
+    """Convert float32 samples in [-1, 1] to little-endian 16-bit PCM bytes."""
+    scaled = audio * np.float32(32767.0)
+    np.clip(scaled, -32768.0, 32767.0, out=scaled)
+    np.rint(scaled, out=scaled)
+    return scaled.astype("<i2").tobytes()
+
+
+def save_wav(
+    audio: np.ndarray, sample_rate: int, out_path: Union[Path, BinaryIO]
+) -> Union[Path, BinaryIO]:
+    """Save mono float32 audio as WAV to a file path or binary file object.
 
     Parameters
     ----------
@@ -44,50 +71,106 @@ def save_wav(audio: np.ndarray, sample_rate: int, out_path: Path) -> Path:
         1-D float32 numpy array in [-1, 1].
     sample_rate: int
         Sampling rate in Hz.
-    out_path: Path
-        Destination path for the WAV file.
+    out_path: Path or binary file object
+        Destination path for the WAV file, or a writable (seekable) binary
+        stream such as ``io.BytesIO``. Streams are left open, positioned at
+        the end of the written data.
     """
     _validate_audio_input(audio, sample_rate)
 
-    _ensure_parent_dir(out_path)
-    sf.write(str(out_path), audio.astype(np.float32), samplerate=sample_rate, subtype="PCM_16")
-    if not out_path.exists() or out_path.stat().st_size == 0:
+    is_path = isinstance(out_path, (str, Path))
+    if is_path:
+        out_path = Path(out_path)
+        _ensure_parent_dir(out_path)
+    # Mono 16-bit PCM needs nothing beyond the stdlib `wave` writer.
+    with wave.open(str(out_path) if is_path else out_path, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(sample_rate)
+        w.writeframes(_to_pcm16(audio))
+    if is_path and (not out_path.exists() or out_path.stat().st_size == 0):
         raise IOError(f"Failed to write WAV file at {out_path}")
     return out_path
 
 
-def save_mp3(audio: np.ndarray, sample_rate: int, out_path: Path) -> Path:
-    """Save audio to MP3 via pydub/ffmpeg.
+def save_mp3(
+    audio: np.ndarray, sample_rate: int, out_path: Union[Path, BinaryIO]
+) -> Union[Path, BinaryIO]:
+    """Save audio to MP3 via pydub/ffmpeg, to a file path or binary file object.
 
-    This writes a temporary WAV first and converts to MP3 using pydub.
+    The samples are converted to 16-bit PCM in memory and handed to pydub
+    directly, so no intermediate WAV file is written. Streams such as
+    ``io.BytesIO`` are left open; pydub rewinds them to the start.
     """
-    if not PYDUB_AVAILABLE:
+    try:
+        from pydub import AudioSegment
+    except ImportError:
         raise RuntimeError(
             "MP3 export not available. pydub is not compatible with Python 3.13. "
             "Use WAV format instead or upgrade to a compatible Python version."
         )
     
+    if _ffmpeg_path() is None:
+        raise RuntimeError("MP3 export not available. ffmpeg was not found on PATH.")
+
     _validate_audio_input(audio, sample_rate)
 
-    _ensure_parent_dir(out_path)
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-        tmp_wav = Path(tmp.name)
-    try:
-        save_wav(audio, sample_rate, tmp_wav)
-        seg = AudioSegment.from_wav(str(tmp_wav))
-        seg.export(str(out_path), format="mp3")
-    finally:
-        try:
-            if tmp_wav.exists():
-                tmp_wav.unlink()
-        except Exception:
-            pass
+    is_path = isinstance(out_path, (str, Path))
+    if is_path:
+        out_path = Path(out_path)
+        _ensure_parent_dir(out_path)
+    seg = AudioSegment(data=_to_pcm16(audio), sample_width=2, frame_rate=sample_rate, channels=1)
+    seg.export(str(out_path) if is_path else out_path, format="mp3")
 
-    if not out_path.exists() or out_path.stat().st_size == 0:
+    if is_path and (not out_path.exists() or out_path.stat().st_size == 0):
         raise IOError(f"Failed to write MP3 file at {out_path}")
     return out_path
 
 
+# One min/max bucket (two points) per horizontal pixel of the 10x3in, 100 dpi
+# figure.
+_PLOT_MAX_BUCKETS = 10 * 100
+
+
+def _minmax_envelope(audio: np.ndarray, sample_rate: int, buckets: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Reduce ``audio`` to an interleaved min/max envelope of ``2 * buckets`` points.
+
+    The rendered line looks the same as plotting every sample once there are
+    more samples than pixels, but Agg only has to tessellate O(pixels) segments.
+    Trailing samples that do not fill a whole bucket are dropped.
+    """
+    block = len(audio) // buckets
+    frames = audio[: buckets * block].reshape(buckets, block)
+    env = np.empty(2 * buckets, dtype=audio.dtype)
+    env[0::2] = frames.min(axis=1)
+    env[1::2] = frames.max(axis=1)
+    t = np.repeat(np.arange(buckets, dtype=np.float32), 2)
+    t *= block / sample_rate
+    return t, env
+
+
+def _render_waveform(audio: np.ndarray, sample_rate: int, sink: Union[str, BinaryIO]) -> None:
+    """Render the waveform PNG into ``sink`` (a filename or binary file object)."""
+    # Render straight through the Agg canvas; pyplot's figure manager and
+    # GUI backend selection are never touched.
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    if len(audio) > 2 * _PLOT_MAX_BUCKETS:
+        t, audio = _minmax_envelope(audio, sample_rate, _PLOT_MAX_BUCKETS)
+    else:
+        # float32 is plenty for plot coordinates and halves the axis memory
+        t = np.arange(len(audio), dtype=np.float32)
+        t *= 1.0 / sample_rate
+
+    fig = Figure(figsize=(10, 3))
+    ax = fig.subplots()
+    ax.plot(t, audio, color="#1f77b4", linewidth=1.0)
+    ax.set(title="Waveform", xlabel="Time (s)", ylabel="Amplitude")
+    fig.tight_layout()
+    FigureCanvasAgg(fig).print_png(sink)
+
+
 def plot_waveform(audio: np.ndarray, sample_rate: int, out_png: Path) -> Path:
     """Plot waveform and save to a PNG file.
 
@@ -96,21 +179,17 @@ def plot_waveform(audio: np.ndarray, sample_rate: int, out_png: Path) -> Path:
     _validate_audio_input(audio, sample_rate)
 
     _ensure_parent_dir(out_png)
-
-    duration = len(audio) / float(sample_rate)
-    t = np.linspace(0.0, duration, num=len(audio), endpoint=False)
-
-    plt.figure(figsize=(10, 3))
-    plt.plot(t, audio, color="#1f77b4", linewidth=1.0)
-    plt.title("Waveform")
-    plt.xlabel("Time (s)")
-    plt.ylabel("Amplitude")
-    plt.tight_layout()
-    plt.savefig(str(out_png))
-    plt.close()
+    _render_waveform(audio, sample_rate, str(out_png))
 
     if not out_png.exists() or out_png.stat().st_size == 0:
         raise IOError(f"Failed to write waveform PNG at {out_png}")
     return out_png
 
 
+def plot_waveform_bytes(audio: np.ndarray, sample_rate: int) -> bytes:
+    """Plot waveform and return the PNG as bytes, without touching disk."""
+    _validate_audio_input(audio, sample_rate)
+
+    buf = io.BytesIO()
+    _render_waveform(audio, sample_rate, buf)
+    return buf.getvalue()
@@ -2,13 +2,26 @@ from __future__ import annotations
 
 import sys
 import os
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, Optional, Tuple, Protocol
+from importlib.util import find_spec
+from types import MappingProxyType
+from uuid import uuid4
+from typing import Callable, Dict, Iterator, Mapping, Optional, Tuple, Protocol, TYPE_CHECKING
 import io
+from pathlib import Path
 
 import numpy as np
 
+if TYPE_CHECKING:
+    import openai
+
 # Engine enumeration
 class TTSEngine(str, Enum):
     GTTS = "gtts"
@@ -26,26 +39,228 @@ class TTSProtocol(Protocol):
         speed: float = 1.0,
         pitch: Optional[float] = None,
     ) -> Tuple[np.ndarray, int]:
-        """Synthesize speech and return (audio, sample_rate)."""
+        """Synthesize speech and return (audio, sample_rate).
+
+        The audio is normally a writable array owned by the caller, but
+        engines that cache results (gTTS) may return a read-only view on a
+        cache hit; copy it before modifying in place.
+        """
         ...
 
 
-# Language mapping
-LANGUAGE_MAP: Dict[str, str] = {
+# Language mapping (read-only)
+LANGUAGE_MAP: Mapping[str, str] = MappingProxyType({
     "en": "en",
     "tr": "tr",
     "English (US)": "en",
     "English (UK)": "en",  # Note: gTTS doesn't support UK accent
     "Turkish": "tr",
-}
+})
+
+# Precomputed once for validation and error messages
+_LANG_KEYS = frozenset(LANGUAGE_MAP)
+_LANG_KEYS_TUPLE = tuple(LANGUAGE_MAP)
 
 
-@dataclass
+@dataclass(slots=True)
 class _LoadedModel:
     language: str
     tts: object
 
 
+# With more than one worker, texts longer than this are split into sentences
+# synthesized concurrently
+_PARALLEL_MIN_CHARS = 200
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def _synthesize_sentences(
+    synthesize_one: Callable[[str], Tuple[np.ndarray, int]],
+    text: str,
+    max_workers: int = 1,
+) -> Tuple[np.ndarray, int]:
+    """Synthesize long text sentence by sentence on a small thread pool.
+    
+    Network-bound engines spend most of each request waiting on the round-trip,
+    so overlapping the per-sentence requests cuts wall time. The cost is one
+    request per sentence in a burst, which can trip gTTS/OpenAI rate limits,
+    and a short gap at each join where every chunk carries its own encoder
+    padding. The default of one worker therefore sends the text as a single
+    request; callers opt in with ``max_workers > 1``. Chunks are joined in
+    input order; short or single-sentence text is synthesized directly.
+    """
+    sentences = []
+    if max_workers > 1 and len(text) > _PARALLEL_MIN_CHARS:
+        sentences = [s for s in _SENTENCE_END.split(text) if s.strip()]
+    if len(sentences) < 2:
+        return synthesize_one(text)
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(sentences))) as pool:
+        results = list(pool.map(synthesize_one, sentences))
+    
+    audio = np.concatenate([chunk for chunk, _ in results], dtype=np.float32)
+    return audio, results[0][1]
+
+
+def _maybe_clip(audio: np.ndarray) -> np.ndarray:
+    """Clamp float32 audio to [-1, 1], skipping the write pass when already in range.
+    
+    Decoders usually return normalized samples, so two read-only min/max
+    probes replace an unconditional read+write clip over the whole buffer.
+    """
+    if audio.size and (audio.max() > 1.0 or audio.min() < -1.0):
+        if not audio.flags.writeable:
+            audio = audio.copy()
+        np.clip(audio, -1.0, 1.0, out=audio)
+    return audio
+
+
+def _finalize_audio(audio_data: np.ndarray) -> np.ndarray:
+    """Return decoder output as 1-D float32 clamped to [-1, 1].
+    
+    Stereo is averaged straight into a float32 buffer, float32 mono is used
+    as-is, anything else is cast once; clipping happens only if needed.
+    """
+    if audio_data.ndim > 1:
+        audio = np.empty(audio_data.shape[0], dtype=np.float32)
+        np.mean(audio_data, axis=1, dtype=np.float32, out=audio)
+    else:
+        # A view (no copy) when the decoder already returned contiguous float32
+        audio = np.ascontiguousarray(audio_data, dtype=np.float32).ravel()
+    return _maybe_clip(audio)
+
+
+@contextmanager
+def _atomic_output(out_path: Path) -> Iterator[Path]:
+    """Yield a temp path beside `out_path`, moved into place only on success.
+    
+    A failed request leaves no empty or partial file behind, and an existing
+    `out_path` is untouched until the new file is complete.
+    """
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    # Reserved with a plain exclusive open rather than tempfile.mkstemp, so the
+    # file gets the usual umask-derived mode (mkstemp's 0600 would survive
+    # the rename and leave outputs owner-only)
+    tmp_path = out_path.with_name(f".{out_path.stem}.{uuid4().hex}{out_path.suffix}")
+    with open(tmp_path, "xb"):
+        pass
+    try:
+        yield tmp_path
+        tmp_path.replace(out_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+# Engine/decoder dependencies resolved once per process by the _lazy_* helpers.
+# _UNSET marks "not probed yet"; None marks an optional package that is missing.
+_UNSET = object()
+_GTTS = _UNSET
+_MINIAUDIO = _UNSET
+_AUDIOSEGMENT = _UNSET
+_SF = _UNSET
+
+
+def _lazy_gtts():
+    """Return the `gTTS` class; raises ImportError if gTTS is not installed."""
+    global _GTTS
+    if _GTTS is _UNSET:
+        from gtts import gTTS
+        _GTTS = gTTS
+    return _GTTS
+
+
+def _lazy_miniaudio():
+    """Return the `miniaudio` module, or None if it is not installed."""
+    global _MINIAUDIO
+    if _MINIAUDIO is _UNSET:
+        try:
+            import miniaudio
+        except ImportError:
+            miniaudio = None
+        _MINIAUDIO = miniaudio
+    return _MINIAUDIO
+
+
+def _lazy_pydub():
+    """Return pydub's `AudioSegment`, or None if pydub cannot be imported."""
+    global _AUDIOSEGMENT
+    if _AUDIOSEGMENT is _UNSET:
+        try:
+            from pydub import AudioSegment
+        except ImportError:
+            AudioSegment = None
+        _AUDIOSEGMENT = AudioSegment
+    return _AUDIOSEGMENT
+
+
+def _lazy_sf():
+    """Return the `soundfile` module; raises ImportError if it is not installed."""
+    global _SF
+    if _SF is _UNSET:
+        import soundfile
+        _SF = soundfile
+    return _SF
+
+
+def _decode_mp3(audio_bytes: bytes) -> Tuple[np.ndarray, int]:
+    """Decode MP3 bytes to (samples, sample_rate).
+    
+    Prefers miniaudio, which decodes in-process straight to mono float32 at the
+    native rate. Falls back to pydub (ffmpeg subprocess), then to a direct
+    soundfile read.
+    """
+    miniaudio = _lazy_miniaudio()
+    if miniaudio is not None:
+        info = miniaudio.mp3_get_info(audio_bytes)
+        decoded = miniaudio.decode(
+            audio_bytes,
+            output_format=miniaudio.SampleFormat.FLOAT32,
+            nchannels=1,
+            sample_rate=info.sample_rate,
+        )
+        return np.frombuffer(decoded.samples, dtype=np.float32), decoded.sample_rate
+    
+    AudioSegment = _lazy_pydub()
+    if AudioSegment is None:
+        # Fallback: try direct soundfile read (may not work for MP3)
+        return _lazy_sf().read(io.BytesIO(audio_bytes))
+    
+    # Load MP3 from bytes
+    audio_segment = AudioSegment.from_mp3(io.BytesIO(audio_bytes))
+    
+    # Convert to mono if stereo
+    if audio_segment.channels > 1:
+        audio_segment = audio_segment.set_channels(1)
+    
+    # View the segment's sample array directly instead of re-exporting a WAV
+    sample_width = audio_segment.sample_width
+    dtype = {1: np.int8, 2: np.int16, 4: np.int32}[sample_width]
+    samples = np.frombuffer(audio_segment.get_array_of_samples(), dtype=dtype)
+    audio = samples.astype(np.float32)
+    audio *= 1.0 / (1 << (8 * sample_width - 1))
+    return audio, audio_segment.frame_rate
+
+
+# Expensive state lives at module level and is shared by every service
+# instance, so `get_tts` can hand out cheap, independent services (each with
+# its own default language) without reloading models or reconnecting.
+
+# gTTS results keyed by (language, text hash), most recently used last
+_GTTS_AUDIO_CACHE: "OrderedDict[Tuple[str, str], Tuple[np.ndarray, int]]" = OrderedDict()
+_GTTS_AUDIO_CACHE_SIZE = 64
+# Streamlit may call synthesize from several script threads
+_GTTS_AUDIO_CACHE_LOCK = threading.Lock()
+
+# Loaded Coqui models keyed by model name; loads take seconds
+_COQUI_MODELS: Dict[str, _LoadedModel] = {}
+_COQUI_MODELS_LOCK = threading.Lock()
+
+# OpenAI clients keyed by API key, so their HTTP connection pools are reused
+_OPENAI_CLIENTS: Dict[str, "openai.OpenAI"] = {}
+_OPENAI_CLIENTS_LOCK = threading.Lock()
+
+
 class GttsTTSService:
     """gTTS-based TTS service with lazy-loading and per-language cache.
     
@@ -57,34 +272,46 @@ class GttsTTSService:
     - Speed and pitch parameters are ignored (gTTS limitation)
     - Speaker parameter is ignored (gTTS limitation)
     - Language mapping: "en" -> English, "tr" -> Turkish
+    - Results are kept in a process-wide LRU cache keyed by (language, text
+      hash), so repeating a request skips the network round-trip and MP3
+      decode. A fresh synthesis returns a writable array; cache hits return
+      read-only views of the stored copy.
+    - ``max_workers > 1`` splits long text into sentences requested
+      concurrently (faster, but bursts requests and adds small gaps at the
+      joins); the default sends one request per text.
     """
     
-    def __init__(self, default_lang: str = "en") -> None:
-        if default_lang not in LANGUAGE_MAP:
-            raise ValueError(f"Unsupported default language: {default_lang!r}. Supported: {list(LANGUAGE_MAP)}")
+    __slots__ = ("_default_lang", "_cache", "_max_workers")
+    
+    def __init__(self, default_lang: str = "en", max_workers: int = 1) -> None:
+        if default_lang not in _LANG_KEYS:
+            raise ValueError(f"Unsupported default language: {default_lang!r}. Supported: {_LANG_KEYS_TUPLE}")
         self._default_lang: str = default_lang
         self._cache: Dict[str, _LoadedModel] = {}
+        self._max_workers = max_workers
     
     def set_language(self, lang: str) -> None:
         """Set the default language used by `synthesize` when `language` is None."""
-        if lang not in LANGUAGE_MAP:
-            raise ValueError(f"Unsupported language: {lang!r}. Supported: {list(LANGUAGE_MAP)}")
+        if lang not in _LANG_KEYS:
+            raise ValueError(f"Unsupported language: {lang!r}. Supported: {_LANG_KEYS_TUPLE}")
         self._default_lang = lang
     
     def _ensure_model(self, lang: str) -> _LoadedModel:
-        if lang in self._cache:
+        # Cache hits are the common case: one lookup, no membership test
+        try:
             return self._cache[lang]
+        except KeyError:
+            pass
         
         # Try to import gTTS
         try:
-            from gtts import gTTS
+            gTTS = _lazy_gtts()
         except ImportError as exc:
             raise RuntimeError("gTTS TTS failed: Ensure 'gTTS' is installed. Run: pip install gTTS") from exc
         
-        # Cache the gTTS class for efficiency
-        loaded = _LoadedModel(language=lang, tts=gTTS)
-        self._cache[lang] = loaded
-        return loaded
+        # Cache the gTTS class for efficiency; the cache is bounded by the
+        # supported languages
+        return self._cache.setdefault(lang, _LoadedModel(language=lang, tts=gTTS))
     
     def synthesize(
         self,
@@ -115,6 +342,29 @@ class GttsTTSService:
             raise ValueError("'text' must be a non-empty string")
         
         lang = (language or self._default_lang).lower()
+        key = (lang, hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest())
+        
+        with _GTTS_AUDIO_CACHE_LOCK:
+            hit = _GTTS_AUDIO_CACHE.get(key)
+            if hit is not None:
+                _GTTS_AUDIO_CACHE.move_to_end(key)
+                return hit[0].view(), hit[1]
+        
+        audio, sample_rate = _synthesize_sentences(
+            lambda chunk: self._synthesize_one(chunk, lang), text, self._max_workers
+        )
+        cached = audio.copy()
+        cached.setflags(write=False)
+        
+        with _GTTS_AUDIO_CACHE_LOCK:
+            _GTTS_AUDIO_CACHE[key] = (cached, sample_rate)
+            _GTTS_AUDIO_CACHE.move_to_end(key)
+            while len(_GTTS_AUDIO_CACHE) > _GTTS_AUDIO_CACHE_SIZE:
+                _GTTS_AUDIO_CACHE.popitem(last=False)
+        return audio, sample_rate
+    
+    def _synthesize_one(self, text: str, lang: str) -> Tuple[np.ndarray, int]:
+        """Run a single uncached gTTS request and decode it to float32."""
         model = self._ensure_model(lang)
         
         try:
@@ -123,46 +373,38 @@ class GttsTTSService:
             tts = model.tts(text=text, lang=lang)
             
             # Get audio bytes
-            audio_bytes_io = io.BytesIO()
-            tts.write_to_fp(audio_bytes_io)
-            audio_bytes = audio_bytes_io.getvalue()
-            
-            # Convert MP3 bytes to waveform using pydub
-            try:
-                from pydub import AudioSegment
-                
-                # Load MP3 from bytes
-                audio_segment = AudioSegment.from_mp3(io.BytesIO(audio_bytes))
-                
-                # Convert to mono if stereo
-                if audio_segment.channels > 1:
-                    audio_segment = audio_segment.set_channels(1)
-                
-                # Export as WAV bytes
-                wav_bytes = io.BytesIO()
-                audio_segment.export(wav_bytes, format="wav")
-                wav_bytes.seek(0)
-                
-                # Read with soundfile
-                import soundfile as sf
-                audio_data, sample_rate = sf.read(wav_bytes)
-                
-            except ImportError:
-                # Fallback: try direct soundfile read (may not work for MP3)
-                import soundfile as sf
-                audio_data, sample_rate = sf.read(io.BytesIO(audio_bytes))
+            buf = io.BytesIO()
+            tts.write_to_fp(buf)
+            audio_bytes = buf.getvalue()
             
-            # Convert to mono if stereo
-            if audio_data.ndim > 1:
-                audio_data = audio_data.mean(axis=1)
+            # Decode MP3 bytes to a waveform
+            audio_data, sample_rate = _decode_mp3(audio_bytes)
                 
         except Exception as exc:
             raise RuntimeError("gTTS TTS failed: Check your internet connection") from exc
         
-        audio = np.asarray(audio_data, dtype=np.float32).flatten()
-        # Clamp to [-1, 1] just in case
-        np.clip(audio, -1.0, 1.0, out=audio)
-        return audio, int(sample_rate)
+        return _finalize_audio(audio_data), int(sample_rate)
+    
+    def synthesize_to_path(self, text: str, out_path: Path, language: Optional[str] = None) -> Path:
+        """Synthesize speech straight to an MP3 file, skipping the decode to numpy.
+        
+        gTTS produces MP3, so `out_path` must end in ``.mp3``; use `synthesize`
+        plus `audio_utils.save_wav` when a WAV file or the samples are needed.
+        """
+        if not isinstance(text, str) or not text.strip():
+            raise ValueError("'text' must be a non-empty string")
+        if out_path.suffix.lower() != ".mp3":
+            raise ValueError(f"gTTS writes MP3 only, got {out_path.suffix!r}")
+        
+        lang = (language or self._default_lang).lower()
+        model = self._ensure_model(lang)
+        
+        try:
+            with _atomic_output(out_path) as tmp_path, open(tmp_path, "wb") as fp:
+                model.tts(text=text, lang=lang).write_to_fp(fp)
+        except Exception as exc:
+            raise RuntimeError("gTTS TTS failed: Check your internet connection") from exc
+        return out_path
 
 
 class CoquiTTSService:
@@ -173,9 +415,13 @@ class CoquiTTSService:
     - May not be available on Python 3.13+ due to compatibility issues
     - Requires model downloads on first use
     - Supports speed/pitch control (when available)
+    - ``max_workers`` is ignored: local synthesis is CPU bound, so the text
+      is never split into concurrent sentence requests
     """
     
-    def __init__(self, default_lang: str = "en") -> None:
+    __slots__ = ("_default_lang", "_model_map")
+    
+    def __init__(self, default_lang: str = "en", max_workers: int = 1) -> None:
         # Check Python version compatibility
         if sys.version_info >= (3, 13):
             raise RuntimeError("Coqui TTS failed: Not supported on Python 3.13+. Use gTTS or OpenAI engines instead")
@@ -187,7 +433,6 @@ class CoquiTTSService:
             raise RuntimeError("Coqui TTS failed: Not available. Install with: pip install coqui-tts")
         
         self._default_lang = default_lang
-        self._cache: Dict[str, _LoadedModel] = {}
         
         # Model mapping for Coqui
         self._model_map = {
@@ -195,6 +440,30 @@ class CoquiTTSService:
             "tr": "tts_models/tr/common-voice/glow-tts",
         }
     
+    def _ensure_model(self, lang: str) -> _LoadedModel:
+        # Model loads take seconds, so each model is loaded once per process
+        # and kept resident for later calls from any service instance
+        model_name = self._model_map[lang]
+        loaded = _COQUI_MODELS.get(model_name)
+        if loaded is not None:
+            return loaded
+        
+        with _COQUI_MODELS_LOCK:
+            loaded = _COQUI_MODELS.get(model_name)
+            if loaded is not None:
+                return loaded
+            
+            from TTS.api import TTS
+            
+            try:
+                import torch
+                device = "cuda" if torch.cuda.is_available() else "cpu"
+            except ImportError:
+                device = "cpu"
+            
+            loaded = _COQUI_MODELS[model_name] = _LoadedModel(language=lang, tts=TTS(model_name).to(device))
+        return loaded
+    
     def synthesize(
         self,
         text: str,
@@ -223,23 +492,14 @@ class CoquiTTSService:
         if not isinstance(text, str) or not text.strip():
             raise ValueError("'text' must be a non-empty string")
         
-        # Check Python version compatibility
-        if sys.version_info >= (3, 13):
-            raise RuntimeError("Coqui TTS failed: Not supported on Python 3.13+. Use gTTS or OpenAI engines instead")
-        
+        # Python version and package availability were checked in __init__
         lang = (language or self._default_lang).lower()
         if lang not in self._model_map:
             raise ValueError(f"Unsupported language: {lang!r}. Supported: {list(self._model_map)}")
         
         try:
-            from TTS.api import TTS
-        except ImportError:
-            raise RuntimeError("Coqui TTS failed: Not available. Install with: pip install coqui-tts")
-        
-        try:
-            # Initialize TTS with the appropriate model
-            model_name = self._model_map[lang]
-            tts = TTS(model_name)
+            # Load (or reuse) the model for this language
+            tts = self._ensure_model(lang).tts
             
             # Generate speech
             # Note: Coqui TTS parameters vary by model, so we use defaults
@@ -256,17 +516,51 @@ class CoquiTTSService:
             if audio.max() > 0:
                 audio = audio / audio.max()
             
-            # Clamp to [-1, 1] just in case
-            np.clip(audio, -1.0, 1.0, out=audio)
+            # Clamp to [-1, 1] just in case (negative peaks may exceed -1)
+            audio = _maybe_clip(audio)
             
-            # Coqui typically uses 22050 Hz sample rate
-            # Note: This is an assumption; actual sample rate may differ per model
-            sample_rate = 22050
+            # Use the model's own output rate; 22050 Hz is the common Coqui default
+            synthesizer = getattr(tts, "synthesizer", None)
+            sample_rate = int(getattr(synthesizer, "output_sample_rate", 0) or 22050)
             
             return audio, sample_rate
             
         except Exception as exc:
             raise RuntimeError("Coqui TTS failed: Check your internet connection and try again")
+    
+    def synthesize_to_path(self, text: str, out_path: Path, language: Optional[str] = None) -> Path:
+        """Synthesize speech straight to a WAV file via Coqui's own writer."""
+        if not isinstance(text, str) or not text.strip():
+            raise ValueError("'text' must be a non-empty string")
+        
+        lang = (language or self._default_lang).lower()
+        if lang not in self._model_map:
+            raise ValueError(f"Unsupported language: {lang!r}. Supported: {list(self._model_map)}")
+        
+        try:
+            with _atomic_output(out_path) as tmp_path:
+                self._ensure_model(lang).tts.tts_to_file(text=text, file_path=str(tmp_path))
+        except Exception as exc:
+            raise RuntimeError("Coqui TTS failed: Check your internet connection and try again")
+        return out_path
+
+
+# OpenAI's `pcm` response format is fixed at 24 kHz, 16-bit signed, mono
+_OPENAI_PCM_SAMPLE_RATE = 24000
+
+
+def _read_stream(response, chunk_size: int = 65536) -> bytearray:
+    """Read a streamed HTTP body into one buffer sized from Content-Length."""
+    buf = bytearray(int(response.headers.get("content-length") or 0))
+    offset = 0
+    for chunk in response.iter_bytes(chunk_size=chunk_size):
+        end = offset + len(chunk)
+        # Slice assignment fills the preallocated space and grows past it
+        # if the server sent more than advertised
+        buf[offset:end] = chunk
+        offset = end
+    del buf[offset:]
+    return buf
 
 
 class OpenAITTSService:
@@ -274,21 +568,59 @@ class OpenAITTSService:
     
     Notes
     -----
-    - Requires OPENAI_API_KEY environment variable
+    - Requires OPENAI_API_KEY environment variable (read when the service is created)
     - Speed and pitch parameters are ignored (OpenAI API limitation)
     - Speaker parameter is ignored (OpenAI API limitation)
     - Language mapping: "en" -> English, "tr" -> Turkish
+    - The API client is created on first use and shared per API key, so its
+      HTTP connection pool survives across requests and service instances.
+      Call `close()` to release it.
+    - ``max_workers > 1`` splits long text into sentences requested
+      concurrently (faster, but bursts requests and adds small gaps at the
+      joins); the default sends one request per text.
     """
     
-    def __init__(self, default_lang: str = "en") -> None:
-        if default_lang not in LANGUAGE_MAP:
-            raise ValueError(f"Unsupported default language: {default_lang!r}. Supported: {list(LANGUAGE_MAP)}")
+    __slots__ = ("_default_lang", "_api_key", "_max_workers")
+    
+    def __init__(self, default_lang: str = "en", max_workers: int = 1) -> None:
+        if default_lang not in _LANG_KEYS:
+            raise ValueError(f"Unsupported default language: {default_lang!r}. Supported: {_LANG_KEYS_TUPLE}")
         self._default_lang: str = default_lang
+        # Read once; a missing key is reported when synthesis is attempted
+        self._api_key: Optional[str] = os.getenv("OPENAI_API_KEY")
+        self._max_workers = max_workers
+    
+    def _require_api_key(self) -> str:
+        # Shared instances may outlive the environment they were built in, so
+        # a missing key is looked up again before giving up
+        if not self._api_key:
+            self._api_key = os.getenv("OPENAI_API_KEY")
+            if not self._api_key:
+                raise RuntimeError("OpenAI TTS failed: OPENAI_API_KEY environment variable not set")
+        return self._api_key
+    
+    def _get_client(self, api_key: str) -> "openai.OpenAI":
+        client = _OPENAI_CLIENTS.get(api_key)
+        if client is None:
+            # Sentence workers may ask for the client at the same time
+            with _OPENAI_CLIENTS_LOCK:
+                client = _OPENAI_CLIENTS.get(api_key)
+                if client is None:
+                    import openai
+                    client = _OPENAI_CLIENTS[api_key] = openai.OpenAI(api_key=api_key)
+        return client
+    
+    def close(self) -> None:
+        """Close the shared API client for this service's key, if one was created."""
+        with _OPENAI_CLIENTS_LOCK:
+            client = _OPENAI_CLIENTS.pop(self._api_key, None) if self._api_key else None
+        if client is not None:
+            client.close()
     
     def set_language(self, lang: str) -> None:
         """Set the default language used by `synthesize` when `language` is None."""
-        if lang not in LANGUAGE_MAP:
-            raise ValueError(f"Unsupported language: {lang!r}. Supported: {list(LANGUAGE_MAP)}")
+        if lang not in _LANG_KEYS:
+            raise ValueError(f"Unsupported language: {lang!r}. Supported: {_LANG_KEYS_TUPLE}")
         self._default_lang = lang
     
     def synthesize(
@@ -320,73 +652,148 @@ class OpenAITTSService:
             raise ValueError("'text' must be a non-empty string")
         
         # Check for API key
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise RuntimeError("OpenAI TTS failed: OPENAI_API_KEY environment variable not set")
+        api_key = self._require_api_key()
         
         try:
             import openai
         except ImportError:
             raise RuntimeError("OpenAI TTS failed: Not available. Install with: pip install openai")
         
+        return _synthesize_sentences(
+            lambda chunk: self._synthesize_one(chunk, api_key), text, self._max_workers
+        )
+    
+    def _synthesize_one(self, text: str, api_key: str) -> Tuple[np.ndarray, int]:
+        """Run a single OpenAI speech request and convert the PCM to float32."""
         try:
-            client = openai.OpenAI(api_key=api_key)
-            response = client.audio.speech.create(
+            client = self._get_client(api_key)
+            # Stream the body instead of materializing `response.content`;
+            # raw PCM (24 kHz, 16-bit, mono) needs no container or MP3 decode
+            with client.audio.speech.with_streaming_response.create(
                 model="tts-1",
                 voice="alloy",
                 input=text,
-            )
-            
-            # Convert response to numpy array
-            audio_bytes = response.content
-            import soundfile as sf
-            audio_data, sample_rate = sf.read(io.BytesIO(audio_bytes))
-            
-            if audio_data.ndim > 1:
-                audio_data = audio_data.mean(axis=1)
+                response_format="pcm",
+            ) as response:
+                audio_bytes = _read_stream(response)
             
-            audio = np.asarray(audio_data, dtype=np.float32).flatten()
-            np.clip(audio, -1.0, 1.0, out=audio)
-            return audio, int(sample_rate)
+            # Convert little-endian int16 PCM to float32; int16 / 32768 is in
+            # [-1, 1) by construction, so no clipping pass is needed
+            pcm = np.frombuffer(audio_bytes, dtype="<i2", count=len(audio_bytes) // 2)
+            audio = pcm.astype(np.float32)
+            audio *= 1.0 / 32768.0
+            return audio, _OPENAI_PCM_SAMPLE_RATE
             
         except Exception as exc:
             raise RuntimeError("OpenAI TTS failed: Check your API key and network connectivity")
+    
+    def synthesize_to_path(self, text: str, out_path: Path, language: Optional[str] = None) -> Path:
+        """Stream OpenAI speech straight to a ``.wav`` or ``.mp3`` file.
+        
+        The response is written chunk by chunk in the container matching the
+        file suffix, without decoding to numpy.
+        """
+        if not isinstance(text, str) or not text.strip():
+            raise ValueError("'text' must be a non-empty string")
+        
+        response_format = out_path.suffix.lower().lstrip(".")
+        if response_format not in ("wav", "mp3"):
+            raise ValueError(f"Unsupported output format: {out_path.suffix!r}. Supported: ('.wav', '.mp3')")
+        
+        api_key = self._require_api_key()
+        
+        try:
+            import openai
+        except ImportError:
+            raise RuntimeError("OpenAI TTS failed: Not available. Install with: pip install openai")
+        
+        try:
+            client = self._get_client(api_key)
+            with _atomic_output(out_path) as tmp_path, client.audio.speech.with_streaming_response.create(
+                model="tts-1",
+                voice="alloy",
+                input=text,
+                response_format=response_format,
+            ) as response, open(tmp_path, "wb") as fp:
+                for chunk in response.iter_bytes(chunk_size=65536):
+                    fp.write(chunk)
+        except Exception as exc:
+            raise RuntimeError("OpenAI TTS failed: Check your API key and network connectivity")
+        return out_path
+
 
 
 
 
+# Engine code -> service class, keyed by plain strings for a single dict lookup
+_ENGINES: Dict[str, Callable[..., TTSProtocol]] = {
+    TTSEngine.GTTS.value: GttsTTSService,
+    TTSEngine.OPENAI.value: OpenAITTSService,
+    TTSEngine.COQUI.value: CoquiTTSService,
+}
+_ENGINE_NAMES = tuple(_ENGINES)
 
-def get_tts(engine: str = "gtts", default_lang: str = "en") -> TTSProtocol:
+def get_tts(engine: str = "gtts", default_lang: str = "en", max_workers: int = 1) -> TTSProtocol:
     """Factory function to get TTS service.
     
     Parameters
     ----------
     engine: str
-        Engine to use: "gtts", "openai", or "coqui"
+        Engine to use: "gtts", "openai", or "coqui" (or a `TTSEngine` member)
     default_lang: str
         Default language for synthesis
+    max_workers: int
+        Concurrent sentence requests for long text (gTTS and OpenAI; ignored
+        by Coqui). The default of 1 sends each text as a single request, which
+        avoids rate-limit bursts and the small gaps at sentence joins.
         
     Returns
     -------
     TTSProtocol
-        TTS service instance with synthesize() method
+        A new TTS service with a synthesize() method. Services are cheap: the
+        audio cache, loaded models and API clients behind them are shared
+        process-wide; call `get_tts.cache_clear()` to drop those.
     """
-    engine = engine.lower()
-    
-    if engine == TTSEngine.GTTS:
-        return GttsTTSService(default_lang=default_lang)
-    
-    elif engine == TTSEngine.OPENAI:
-        return OpenAITTSService(default_lang=default_lang)
-    
-    elif engine == TTSEngine.COQUI:
-        try:
-            return CoquiTTSService(default_lang=default_lang)
-        except RuntimeError as e:
-            raise RuntimeError(f"Coqui TTS failed: {e}")
+    # TTSEngine members and lowercase codes hit directly (TTSEngine is a str
+    # subclass hashing like its value); only other spellings pay for lower()
+    code = engine if engine in _ENGINES else engine.lower()
+    cls = _ENGINES.get(code)
+    if cls is None:
+        raise ValueError(f"Unknown engine: {engine}. Supported: {_ENGINE_NAMES}")
     
-    else:
-        raise ValueError(f"Unknown engine: {engine}. Supported: {[e.value for e in TTSEngine]}")
+    return cls(default_lang=default_lang, max_workers=max_workers)
+
+
+def _clear_shared_caches() -> None:
+    """Drop cached audio and models and close API clients shared by all services."""
+    with _GTTS_AUDIO_CACHE_LOCK:
+        _GTTS_AUDIO_CACHE.clear()
+    with _COQUI_MODELS_LOCK:
+        _COQUI_MODELS.clear()
+    with _OPENAI_CLIENTS_LOCK:
+        clients = list(_OPENAI_CLIENTS.values())
+        _OPENAI_CLIENTS.clear()
+    for client in clients:
+        client.close()
+
+
+get_tts.cache_clear = _clear_shared_caches
+
+
+def is_available(engine: str) -> bool:
+    """Return whether `engine` can be used in this environment.
+
+    Only locates packages (nothing is imported) and checks the Python version
+    and API key, so it is cheap enough to call before building a service.
+    """
+    code = engine if engine in _ENGINES else engine.lower()
+    if code == TTSEngine.GTTS:
+        return find_spec("gtts") is not None
+    if code == TTSEngine.OPENAI:
+        return find_spec("openai") is not None and bool(os.getenv("OPENAI_API_KEY"))
+    if code == TTSEngine.COQUI:
+        return sys.version_info < (3, 13) and find_spec("TTS") is not None
+    raise ValueError(f"Unknown engine: {engine}. Supported: {_ENGINE_NAMES}")
 
 
 # Note: Speed and pitch parameters may be ignored by some engines (e.g., gTTS, OpenAI)
@@ -0,0 +1,23 @@
+import numpy as np
+
+
+def _assert_audio(audio, sr) -> None:
+    """Assert the (audio, sr) contract every TTS engine must honour.
+
+    Audio is a non-empty 1-D float32 numpy array and ``sr`` a positive int.
+    """
+    assert (
+        isinstance(sr, int) and sr > 0
+        and isinstance(audio, np.ndarray)
+        and audio.dtype == np.float32
+        and audio.ndim == 1
+        and audio.size > 0
+    ), f"bad synthesis output: sr={sr!r}, audio={type(audio).__name__} {getattr(audio, 'dtype', None)} {getattr(audio, 'shape', None)}"
+
+
+def _wav_samples(path) -> np.ndarray:
+    """Map the 16-bit PCM payload of a WAV written by ``save_wav`` without copying.
+
+    Assumes the canonical 44-byte header the stdlib ``wave`` writer produces.
+    """
+    return np.memmap(str(path), dtype="<i2", mode="r", offset=44)
@@ -1,5 +1,14 @@
 import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+# numpy is imported inside the helpers that need it, so UI-only runs
+# (``pytest tests/test_ui.py``) never load it.
+if TYPE_CHECKING:
+    import numpy as np
 
 
 def _add_src_to_path() -> None:
@@ -12,3 +21,46 @@ def _add_src_to_path() -> None:
 _add_src_to_path()
 
 
+@lru_cache(maxsize=16)
+def sine(sr: int = 22050, freq: float = 440.0, secs: float = 1.0, amplitude: float = 0.2) -> "np.ndarray":
+    """Read-only float32 sine tone, computed once per parameter set.
+
+    Use ``.copy()`` if a test needs to modify the samples.
+    """
+    import numpy as np
+
+    t = np.linspace(0.0, secs, int(sr * secs), endpoint=False, dtype=np.float32)
+    audio = (np.float32(amplitude) * np.sin(np.float32(2 * np.pi * freq) * t)).astype(np.float32, copy=False)
+    audio.setflags(write=False)
+    return audio
+
+
+@pytest.fixture(scope="session")
+def shared_tmp(tmp_path_factory) -> Path:
+    """One output directory for write-once smoke tests.
+
+    Tests sharing it must use unique file names (e.g. a ``uuid4().hex`` suffix).
+    """
+    return tmp_path_factory.mktemp("tts_out")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _clear_tts_caches(request):
+    """Drop the audio, models and API clients shared by `get_tts` services at session end."""
+
+    def _finalize() -> None:
+        # Only if a test loaded the service module; importing it just to
+        # clear empty caches would pull in numpy for UI-only runs
+        tts_service = sys.modules.get("src.tts_service")
+        if tts_service is not None:
+            tts_service.get_tts.cache_clear()
+
+    request.addfinalizer(_finalize)
+
+
+@pytest.fixture(scope="session")
+def _warm_app():
+    """Import ``src.app`` (and Streamlit with it) once per test session."""
+    import src.app
+
+    return src.app
@@ -1,16 +1,16 @@
 import numpy as np
 from pathlib import Path
 
+import os
 import shutil
 import pytest
 
+from conftest import sine
 from src.audio_utils import save_wav, save_mp3, plot_waveform, PYDUB_AVAILABLE
 
 
 def gen_sine(sr: int = 22050, freq: float = 440.0, secs: float = 1.0) -> tuple[np.ndarray, int]:
-    t = np.linspace(0.0, secs, int(sr * secs), endpoint=False)
-    audio = (0.2 * np.sin(2 * np.pi * freq * t)).astype(np.float32)
-    return audio, sr
+    return sine(sr, freq, secs), sr
 
 
 @pytest.mark.skipif(not PYDUB_AVAILABLE, reason="pydub not available (Python 3.13 compatibility)")
@@ -23,17 +23,17 @@ def test_audio_utils_end_to_end(tmp_path):
     png_path = out_dir / "tone.png"
 
     wav_written = save_wav(audio, sr, wav_path)
-    assert wav_written.exists() and wav_written.stat().st_size > 0
+    assert os.path.getsize(wav_written) > 44
 
     # Skip MP3 if ffmpeg not available
     if shutil.which("ffmpeg"):
         mp3_written = save_mp3(audio, sr, mp3_path)
-        assert mp3_written.exists() and mp3_written.stat().st_size > 0
+        assert os.path.getsize(mp3_written) > 0
     else:
         pytest.skip("ffmpeg not available, skipping MP3 test")
 
     png_written = plot_waveform(audio, sr, png_path)
-    assert png_written.exists() and png_written.stat().st_size > 0
+    assert os.path.getsize(png_written) > 0
 
 
 @pytest.mark.smoke
@@ -49,17 +49,17 @@ def test_audio_utils_edge_cases(tmp_path):
     png_path = out_dir / "short.png"
     
     wav_written = save_wav(short_audio, sr, wav_path)
-    assert wav_written.exists() and wav_written.stat().st_size > 0
+    assert os.path.getsize(wav_written) > 44
     
     png_written = plot_waveform(short_audio, sr, png_path)
-    assert png_written.exists() and png_written.stat().st_size > 0
+    assert os.path.getsize(png_written) > 0
     
     # Test different sample rate
     high_sr_audio, high_sr = gen_sine(sr=48000, freq=880.0, secs=0.1)
     wav_path_high = out_dir / "high_sr.wav"
     
     wav_written_high = save_wav(high_sr_audio, high_sr, wav_path_high)
-    assert wav_written_high.exists() and wav_written_high.stat().st_size > 0
+    assert os.path.getsize(wav_written_high) > 44
 
 
 @pytest.mark.smoke
@@ -81,3 +81,67 @@ def test_audio_round_trip(tmp_path):
     assert np.allclose(audio[:1000], loaded[:1000], atol=1e-4), "Audio not preserved on round-trip"
 
 
+@pytest.mark.smoke
+def test_waveform_envelope_preserves_peaks():
+    """Min/max decimation used for plotting keeps the signal extremes."""
+    from src.audio_utils import _minmax_envelope
+
+    audio, sr = gen_sine(secs=2.0)
+    t, env = _minmax_envelope(audio, sr, 1000)
+
+    assert t.shape == env.shape == (2000,)
+    assert np.isclose(env.max(), audio.max()) and np.isclose(env.min(), audio.min())
+    assert np.all(np.diff(t) >= 0), "Time axis should be monotonic"
+
+
+@pytest.mark.smoke
+def test_save_mp3_requires_ffmpeg(tmp_path, monkeypatch):
+    """MP3 export fails fast with a clear error when ffmpeg is missing."""
+    from src import audio_utils
+
+    if not PYDUB_AVAILABLE:
+        pytest.skip("pydub not available (Python 3.13 compatibility)")
+    monkeypatch.setattr(audio_utils, "_ffmpeg_path", lambda: None)
+    audio, sr = gen_sine(secs=0.1)
+    with pytest.raises(RuntimeError, match="ffmpeg"):
+        audio_utils.save_mp3(audio, sr, tmp_path / "tone.mp3")
+    assert not (tmp_path / "tone.mp3").exists()
+
+
+@pytest.mark.smoke
+def test_plot_waveform_bytes_returns_png():
+    """In-memory waveform rendering yields PNG bytes."""
+    from src.audio_utils import plot_waveform_bytes
+
+    audio, sr = gen_sine(secs=0.25)
+    png = plot_waveform_bytes(audio, sr)
+    assert png.startswith(b"\x89PNG\r\n\x1a\n")
+
+
+@pytest.mark.smoke
+def test_save_wav_to_stream():
+    """save_wav writes into a binary stream and leaves it open."""
+    import io
+    import soundfile as sf
+
+    audio, sr = gen_sine(secs=0.25)
+    sink = io.BytesIO()
+    assert save_wav(audio, sr, sink) is sink
+    assert sink.tell() == 44 + 2 * len(audio)
+
+    sink.seek(0)
+    loaded, sr_loaded = sf.read(sink, dtype="float32")
+    assert sr_loaded == sr and loaded.shape == audio.shape
+
+
+@pytest.mark.smoke
+def test_save_mp3_to_stream():
+    """save_mp3 encodes into a binary stream without touching disk."""
+    import io
+
+    if not PYDUB_AVAILABLE or not shutil.which("ffmpeg"):
+        pytest.skip("MP3 export needs pydub and ffmpeg")
+    audio, sr = gen_sine(secs=0.25)
+    sink = io.BytesIO()
+    assert save_mp3(audio, sr, sink) is sink
+    assert len(sink.getvalue()) > 0
@@ -14,10 +14,13 @@ import json
 import shutil
 import inspect
 from pathlib import Path
+from uuid import uuid4
 
 import numpy as np
 import pytest
 
+from conftest import sine
+
 RUN_E2E = os.getenv("RUN_E2E_ONLINE") == "1"
 
 
@@ -94,23 +97,21 @@ def test_ui_mapping_and_import():
 
 def _gen_sine(sr=22050, freq=440.0, secs=0.25):
     """Generate synthetic sine wave for testing."""
-    t = np.linspace(0, secs, int(sr * secs), endpoint=False, dtype=np.float32)
-    audio = 0.2 * np.sin(2 * np.pi * freq * t, dtype=np.float32)
-    return audio.astype(np.float32), sr
+    return sine(sr, freq, secs), sr
 
 
 @pytest.mark.smoke
-def test_audio_utils_offline(tmp_path):
+def test_audio_utils_offline(shared_tmp):
     """Test audio utilities with synthetic audio (offline)."""
     from src.audio_utils import save_wav, save_mp3, plot_waveform
     audio, sr = _gen_sine()
-    wav = save_wav(audio, sr, tmp_path / "tone.wav")
-    assert wav.exists() and wav.stat().st_size > 0, "WAV not created"
+    wav = save_wav(audio, sr, shared_tmp / f"tone_{uuid4().hex}.wav")
+    assert os.path.getsize(wav) > 44, "WAV not created"
     if shutil.which("ffmpeg"):
-        mp3 = save_mp3(audio, sr, tmp_path / "tone.mp3")
-        assert mp3.exists() and mp3.stat().st_size > 0, "MP3 not created (ffmpeg present)"
-    png = plot_waveform(audio, sr, tmp_path / "tone.png")
-    assert png.exists() and png.stat().st_size > 0, "Waveform PNG not created"
+        mp3 = save_mp3(audio, sr, shared_tmp / f"tone_{uuid4().hex}.mp3")
+        assert os.path.getsize(mp3) > 0, "MP3 not created (ffmpeg present)"
+    png = plot_waveform(audio, sr, shared_tmp / f"tone_{uuid4().hex}.png")
+    assert os.path.getsize(png) > 0, "Waveform PNG not created"
 
 
 @pytest.mark.smoke
@@ -135,7 +136,7 @@ def test_preflight_mentions_core_checks():
 
 @pytest.mark.tts
 @pytest.mark.skipif(not RUN_E2E, reason="Set RUN_E2E_ONLINE=1 to run online E2E synthesis")
-def test_online_e2e_gtts(tmp_path):
+def test_online_e2e_gtts(shared_tmp):
     """Minimal gTTS e2e test (network dependent). Skip on failures gracefully."""
     try:
         from src.tts_service import get_tts
@@ -143,28 +144,28 @@ def test_online_e2e_gtts(tmp_path):
         audio, sr = eng.synthesize("Hello from E2E", language="en")
         assert isinstance(sr, int) and sr > 0 and isinstance(audio, np.ndarray) and audio.size > 0
         from src.audio_utils import save_wav, plot_waveform
-        wav = save_wav(audio, sr, tmp_path / "e2e.wav")
-        png = plot_waveform(audio, sr, tmp_path / "e2e.png")
-        assert wav.exists() and wav.stat().st_size > 0
-        assert png.exists() and png.stat().st_size > 0
+        wav = save_wav(audio, sr, shared_tmp / f"e2e_{uuid4().hex}.wav")
+        png = plot_waveform(audio, sr, shared_tmp / f"e2e_{uuid4().hex}.png")
+        assert os.path.getsize(wav) > 44
+        assert os.path.getsize(png) > 0
     except Exception as e:
         pytest.skip(f"Online E2E skipped due to network/engine issue: {e}")
 
 
 @pytest.mark.smoke
-def test_audio_validation_edge_cases(tmp_path):
+def test_audio_validation_edge_cases(shared_tmp):
     """Test audio utilities handle edge cases correctly."""
     from src.audio_utils import save_wav, plot_waveform
     
     # Test very short audio
     short_audio, sr = _gen_sine(secs=0.05)
-    wav = save_wav(short_audio, sr, tmp_path / "short.wav")
-    assert wav.exists() and wav.stat().st_size > 0, "Short audio WAV not created"
+    wav = save_wav(short_audio, sr, shared_tmp / f"short_{uuid4().hex}.wav")
+    assert os.path.getsize(wav) > 44, "Short audio WAV not created"
     
     # Test different sample rate
     high_sr_audio, high_sr = _gen_sine(sr=48000, freq=880.0)
-    wav_high = save_wav(high_sr_audio, high_sr, tmp_path / "high_sr.wav")
-    assert wav_high.exists() and wav_high.stat().st_size > 0, "High sample rate WAV not created"
+    wav_high = save_wav(high_sr_audio, high_sr, shared_tmp / f"high_sr_{uuid4().hex}.wav")
+    assert os.path.getsize(wav_high) > 44, "High sample rate WAV not created"
 
 
 @pytest.mark.smoke
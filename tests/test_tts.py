@@ -1,194 +1,502 @@
+import contextlib
+import io
 import os
+import shutil
+import stat
 import sys
+import threading
+import time
+import types
+import unicodedata
+import wave
+from collections import OrderedDict
 from pathlib import Path
+from uuid import uuid4
 
 import numpy as np
 import pytest
 
-from src.tts_service import get_tts, TTSEngine
-from src.audio_utils import save_wav
+from _audio_asserts import _assert_audio, _wav_samples
+from conftest import sine
+import src.tts_service as tts_service
+from src.tts_service import get_tts, is_available, TTSEngine
+from src.audio_utils import save_mp3, save_wav, PYDUB_AVAILABLE
 
 
 RUN_TTS = os.getenv("RUN_TTS_TEST") == "1"
+# Sentence workers per service in the long-text test; kept at 1 unless opted
+# in, since parallel bursts can trip gTTS/OpenAI rate limits.
+TTS_WORKERS = max(1, int(os.getenv("RUN_TTS_PARALLEL", "1")))
+
+# Long but reasonable text (~1200 chars, avoids timeouts)
+_LONG_TEXT = "This is a test of long text synthesis. " * 30
+
+# Turkish text with diacritics, in canonical precomposed (NFC) form
+_TURKISH_FIXTURE = unicodedata.normalize("NFC", "Merhaba dünya, çığ köprü şüphe örneği.")
+
+_COQUI_AVAILABLE = is_available("coqui")
+
+
+def _engine_param(engine):
+    return pytest.param(
+        engine, marks=pytest.mark.skipif(not is_available(engine), reason=f"{engine} not available")
+    )
+
+
+# One case per engine so pytest-xdist can spread them across workers
+ENGINES = [_engine_param("gtts"), _engine_param("openai"), _engine_param("coqui")]
+
+
+@pytest.mark.smoke
+def test_save_wav_contract(tmp_path):
+    """Engine-shaped output satisfies the audio contract and saves as mono PCM16 WAV.
+
+    Runs offline on synthetic samples; the engine smoke tests below cover the
+    same path end to end behind RUN_TTS_TEST.
+    """
+    sr = 16000
+    audio = np.linspace(-1.0, 1.0, sr, dtype=np.float32)
+    _assert_audio(audio, sr)
+
+    written = save_wav(audio, sr, tmp_path / "x.wav")
+    assert os.path.getsize(written) == 44 + 2 * sr
+    with wave.open(str(written), "rb") as w:
+        assert (w.getnchannels(), w.getsampwidth(), w.getframerate(), w.getnframes()) == (1, 2, sr, sr)
+
+    samples = _wav_samples(written)
+    assert samples.shape == (sr,)
+    assert samples[0] == -32767 and samples[-1] == 32767
+    assert np.all(np.diff(samples) >= 0), "PCM samples should follow the input ramp"
 
 
 @pytest.mark.skipif(not RUN_TTS, reason="Set RUN_TTS_TEST=1 to run TTS smoke test")
+@pytest.mark.skipif(not is_available("gtts"), reason="gTTS not available")
 @pytest.mark.tts
-def test_gtts_smoke(tmp_path):
+def test_gtts_smoke(shared_tmp):
     """Test gTTS engine (default, works on Python 3.13+)."""
     svc = get_tts(engine="gtts", default_lang="en")
     audio, sr = svc.synthesize("Hello from TTS", language="en")
 
-    assert isinstance(audio, np.ndarray)
-    assert isinstance(sr, int) and sr > 0
-    assert audio.ndim == 1 and audio.dtype == np.float32
+    _assert_audio(audio, sr)
 
-    out_wav = tmp_path / "gtts.wav"
+    out_wav = shared_tmp / f"gtts_{uuid4().hex}.wav"
     written = save_wav(audio, sr, out_wav)
-    assert written.exists() and written.stat().st_size > 0
+    assert os.path.getsize(written) > 44
 
 
 @pytest.mark.skipif(not RUN_TTS, reason="Set RUN_TTS_TEST=1 to run TTS smoke test")
-@pytest.mark.skipif(sys.version_info >= (3, 13), reason="Coqui not supported on Python 3.13+")
+@pytest.mark.skipif(not _COQUI_AVAILABLE, reason="Coqui TTS not available")
 @pytest.mark.tts
-def test_coqui_tts_smoke(tmp_path):
+def test_coqui_tts_smoke():
     """Test Coqui TTS engine (optional, not available on Python 3.13+)."""
-    try:
-        svc = get_tts(engine="coqui", default_lang="en")
-        audio, sr = svc.synthesize("Hello from TTS", language="en")
+    svc = get_tts(engine="coqui", default_lang="en")
+    audio, sr = svc.synthesize("Hello from TTS", language="en")
 
-        assert isinstance(audio, np.ndarray)
-        assert isinstance(sr, int) and sr > 0
-        assert audio.ndim == 1 and audio.dtype == np.float32
+    _assert_audio(audio, sr)
 
-        out_wav = tmp_path / "coqui.wav"
-        written = save_wav(audio, sr, out_wav)
-        assert written.exists() and written.stat().st_size > 0
-    except RuntimeError as e:
-        if "not available" in str(e):
-            pytest.skip(f"Coqui TTS not available: {e}")
-        else:
-            raise
+    sink = io.BytesIO()
+    save_wav(audio, sr, sink)
+    assert sink.tell() > 44  # RIFF header plus at least one frame
 
 
 @pytest.mark.skipif(not RUN_TTS, reason="Set RUN_TTS_TEST=1 to run TTS smoke test")
+@pytest.mark.skipif(not is_available("openai"), reason="OpenAI TTS not available (package or OPENAI_API_KEY missing)")
 @pytest.mark.tts
-def test_openai_tts_smoke(tmp_path):
+def test_openai_tts_smoke():
     """Test OpenAI TTS engine (optional, requires API key)."""
-    if not os.getenv("OPENAI_API_KEY"):
-        pytest.skip("OPENAI_API_KEY not set")
-    
-    try:
-        svc = get_tts(engine="openai", default_lang="en")
-        audio, sr = svc.synthesize("Hello from TTS", language="en")
+    svc = get_tts(engine="openai", default_lang="en")
+    audio, sr = svc.synthesize("Hello from TTS", language="en")
 
-        assert isinstance(audio, np.ndarray)
-        assert isinstance(sr, int) and sr > 0
-        assert audio.ndim == 1 and audio.dtype == np.float32
+    _assert_audio(audio, sr)
 
-        out_wav = tmp_path / "openai.wav"
-        written = save_wav(audio, sr, out_wav)
-        assert written.exists() and written.stat().st_size > 0
-    except RuntimeError as e:
-        if "not available" in str(e) or "not set" in str(e):
-            pytest.skip(f"OpenAI TTS not available: {e}")
-        else:
-            raise
+    sink = io.BytesIO()
+    save_wav(audio, sr, sink)
+    assert sink.tell() > 44  # RIFF header plus at least one frame
 
 
 @pytest.mark.tts
-def test_empty_text_validation():
+@pytest.mark.parametrize("engine", ENGINES)
+def test_empty_text_validation(engine):
     """Test that all engines properly validate empty text input."""
-    engines_to_test = ["gtts"]
+    svc = get_tts(engine=engine, default_lang="en")
     
-    # Add OpenAI if API key is available
-    if os.getenv("OPENAI_API_KEY"):
-        engines_to_test.append("openai")
+    # Test empty string
+    with pytest.raises(ValueError, match="must be a non-empty string"):
+        svc.synthesize("", language="en")
     
-    # Add Coqui if Python < 3.13 and package available
-    if sys.version_info < (3, 13):
-        try:
-            import TTS
-            engines_to_test.append("coqui")
-        except ImportError:
-            pass
-    
-    for engine in engines_to_test:
-        try:
-            svc = get_tts(engine=engine, default_lang="en")
-            
-            # Test empty string
-            with pytest.raises(ValueError, match="must be a non-empty string"):
-                svc.synthesize("", language="en")
-            
-            # Test whitespace-only string
-            with pytest.raises(ValueError, match="must be a non-empty string"):
-                svc.synthesize("   ", language="en")
-                
-        except RuntimeError as e:
-            if "not available" in str(e) or "not set" in str(e):
-                pytest.skip(f"{engine} not available: {e}")
-            else:
-                raise
+    # Test whitespace-only string
+    with pytest.raises(ValueError, match="must be a non-empty string"):
+        svc.synthesize("   ", language="en")
 
 
 @pytest.mark.skipif(not RUN_TTS, reason="Set RUN_TTS_TEST=1 to run TTS smoke test")
 @pytest.mark.tts
-def test_long_text_handling(tmp_path):
-    """Test handling of longer text input (>1000 chars)."""
-    # Create a long but reasonable text (avoid timeouts)
-    long_text = "This is a test of long text synthesis. " * 30  # ~1200 chars
-    
-    engines_to_test = ["gtts"]
+@pytest.mark.parametrize("engine", ENGINES)
+def test_long_text_handling(engine):
+    """Test handling of longer text input (>1000 chars).
+
+    Set RUN_TTS_PARALLEL=N to have the service split the text into sentences
+    requested on N workers.
+    """
+    svc = get_tts(engine=engine, default_lang="en", max_workers=TTS_WORKERS)
     
-    # Add OpenAI if API key is available
-    if os.getenv("OPENAI_API_KEY"):
-        engines_to_test.append("openai")
+    # Test long text synthesis
+    audio, sr = svc.synthesize(_LONG_TEXT, language="en")
     
-    # Add Coqui if Python < 3.13 and package available
-    if sys.version_info < (3, 13):
-        try:
-            import TTS
-            engines_to_test.append("coqui")
-        except ImportError:
-            pass
+    # Basic validation
+    _assert_audio(audio, sr)
     
-    for engine in engines_to_test:
-        try:
-            svc = get_tts(engine=engine, default_lang="en")
-            
-            # Test long text synthesis
-            audio, sr = svc.synthesize(long_text, language="en")
-            
-            # Basic validation
-            assert isinstance(audio, np.ndarray)
-            assert isinstance(sr, int) and sr > 0
-            assert audio.ndim == 1 and audio.dtype == np.float32
-            assert len(audio) > 0, "Long text should produce audio"
-            
-            # Save to verify it works
-            out_wav = tmp_path / f"long_text_{engine}.wav"
-            written = save_wav(audio, sr, out_wav)
-            assert written.exists() and written.stat().st_size > 0
-                
-        except RuntimeError as e:
-            if "not available" in str(e) or "not set" in str(e):
-                pytest.skip(f"{engine} not available: {e}")
-            elif "rate limit" in str(e).lower() or "timeout" in str(e).lower():
-                pytest.skip(f"{engine} rate limited or timed out: {e}")
-            else:
-                raise
+    # Save to verify it works
+    sink = io.BytesIO()
+    save_wav(audio, sr, sink)
+    assert sink.tell() > 44  # RIFF header plus at least one frame
 
 
 @pytest.mark.skipif(not RUN_TTS, reason="Set RUN_TTS_TEST=1 to run TTS smoke test")
+@pytest.mark.skipif(not is_available("gtts"), reason="gTTS not available")
 @pytest.mark.tts
-def test_unicode_turkish_diacritics(tmp_path):
+def test_unicode_turkish_diacritics():
     """Test Unicode text with Turkish diacritics."""
-    # Turkish text with diacritics
-    turkish_text = "Merhaba dünya, çığ köprü şüphe örneği."
-    
     # Test with gTTS (most reliable for Unicode)
-    try:
-        svc = get_tts(engine="gtts", default_lang="tr")
-        
-        # Test Turkish text synthesis
-        audio, sr = svc.synthesize(turkish_text, language="tr")
-        
-        # Basic validation
-        assert isinstance(audio, np.ndarray)
-        assert isinstance(sr, int) and sr > 0
-        assert audio.ndim == 1 and audio.dtype == np.float32
-        assert len(audio) > 0, "Turkish text should produce audio"
-        
-        # Save to verify it works
-        out_wav = tmp_path / "turkish_unicode.wav"
-        written = save_wav(audio, sr, out_wav)
-        assert written.exists() and written.stat().st_size > 0
-        
-    except RuntimeError as e:
-        if "not available" in str(e) or "network" in str(e).lower():
-            pytest.skip(f"gTTS not available or network issue: {e}")
-        else:
-            raise
+    svc = get_tts(engine="gtts", default_lang="tr")
+    
+    # Test Turkish text synthesis
+    audio, sr = svc.synthesize(_TURKISH_FIXTURE, language="tr")
+    
+    # Basic validation
+    _assert_audio(audio, sr)
+    
+    # Save to verify it works
+    sink = io.BytesIO()
+    save_wav(audio, sr, sink)
+    assert sink.tell() > 44  # RIFF header plus at least one frame
+
+
+@pytest.fixture
+def fake_gtts(monkeypatch):
+    """Offline gTTS: each request writes ``b"ID3" + text`` and is recorded.
+
+    Set ``stub.error`` to make requests fail after writing. The shared audio
+    cache starts empty and is restored afterwards.
+    """
+    stub = types.SimpleNamespace(requests=[], error=None)
+
+    class _FakeGTTS:
+        def __init__(self, text, lang):
+            self.text = text
+            stub.requests.append((text, lang))
+
+        def write_to_fp(self, fp):
+            fp.write(b"ID3" + self.text.encode("utf-8"))
+            if stub.error is not None:
+                raise stub.error
+
+    monkeypatch.setattr(tts_service, "_lazy_gtts", lambda: _FakeGTTS)
+    monkeypatch.setattr(tts_service, "_GTTS_AUDIO_CACHE", OrderedDict())
+    return stub
+
+
+@pytest.fixture
+def fake_openai(monkeypatch):
+    """Offline OpenAI client registered for the ``test-key`` API key.
+
+    ``stub.respond(text)`` gives the streamed body (16-bit PCM by default);
+    requests whose input is in ``stub.fail_inputs`` break mid-stream.
+    """
+    stub = types.SimpleNamespace(
+        requests=[],
+        fail_inputs=set(),
+        respond=lambda text: np.array([0, 16384, -32768, 32767], dtype="<i2").tobytes(),
+    )
+
+    class _Response:
+        def __init__(self, body, fail):
+            self.headers = {"content-length": str(len(body))}
+            self.body = body
+            self.fail = fail
+
+        def iter_bytes(self, chunk_size=None):
+            yield self.body[:3]
+            if self.fail:
+                raise ConnectionError("reset")
+            yield self.body[3:]
+
+    @contextlib.contextmanager
+    def _create(**kwargs):
+        stub.requests.append(kwargs)
+        yield _Response(stub.respond(kwargs["input"]), kwargs["input"] in stub.fail_inputs)
+
+    speech = types.SimpleNamespace(with_streaming_response=types.SimpleNamespace(create=_create))
+    client = types.SimpleNamespace(audio=types.SimpleNamespace(speech=speech))
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(tts_service, "_OPENAI_CLIENTS", {"test-key": client})
+    return stub
+
+
+def test_gtts_audio_cache(fake_gtts, monkeypatch):
+    """Repeated gTTS requests are served from the shared audio cache."""
+    monkeypatch.setattr(
+        tts_service, "_decode_mp3", lambda _: (np.full(8, 0.5, dtype=np.float32), 24000)
+    )
+    monkeypatch.setattr(tts_service, "_GTTS_AUDIO_CACHE_SIZE", 1)
+    svc = tts_service.GttsTTSService(default_lang="en")
+
+    first, sr = svc.synthesize("Hello", language="en")
+    second, _ = svc.synthesize("Hello", language="en")
+    assert len(fake_gtts.requests) == 1 and sr == 24000
+    # Misses hand out a writable array, hits a read-only view of the cache
+    assert first.flags.writeable and not second.flags.writeable
+    assert not np.shares_memory(first, second)
+    first[:] = 0.0
+    assert np.allclose(svc.synthesize("Hello", language="en")[0], 0.5)
+
+    # Capacity 1: a new text evicts the old entry
+    svc.synthesize("Other", language="en")
+    svc.synthesize("Hello", language="en")
+    assert len(fake_gtts.requests) == 3
+
+
+def test_openai_pcm_decoding(fake_openai):
+    """OpenAI raw PCM responses are converted to float32 at 24 kHz."""
+    svc = tts_service.OpenAITTSService(default_lang="en")
+
+    audio, sr = svc.synthesize("Hello", language="en")
+    assert fake_openai.requests[0]["response_format"] == "pcm"
+    assert sr == 24000 and audio.dtype == np.float32
+    assert np.allclose(audio, [0.0, 0.5, -1.0, 32767 / 32768])
+
+
+def test_decode_mp3_with_miniaudio(monkeypatch):
+    """MP3 bytes decode in-process to mono float32 at the native rate."""
+    if tts_service._lazy_miniaudio() is None:
+        pytest.skip("miniaudio not installed")
+    if not PYDUB_AVAILABLE or not shutil.which("ffmpeg"):
+        pytest.skip("building the MP3 fixture needs pydub and ffmpeg")
+    buf = io.BytesIO()
+    save_mp3(sine(sr=24000, secs=0.5), 24000, buf)
+    # Fail loudly if decoding falls through to the pydub/soundfile fallbacks
+    def _unexpected():
+        raise AssertionError("MP3 decode fell back past miniaudio")
+
+    monkeypatch.setattr(tts_service, "_lazy_pydub", _unexpected)
+    monkeypatch.setattr(tts_service, "_lazy_sf", _unexpected)
+
+    audio, sr = tts_service._decode_mp3(buf.getvalue())
+    assert sr == 24000 and audio.dtype == np.float32 and audio.ndim == 1
+    # MP3 encoders pad with priming samples, so the length is only approximate
+    assert 0.45 * sr < audio.size < 0.6 * sr
+    assert 0.1 < np.abs(audio).max() <= 1.0
+
+
+def test_openai_client_created_once_across_threads(monkeypatch):
+    """Concurrent sentence workers share a single OpenAI client."""
+    built = []
+
+    class _FakeOpenAI:
+        def __init__(self, api_key):
+            time.sleep(0.01)  # widen the window a racy check would lose
+            built.append(api_key)
+
+    monkeypatch.setitem(sys.modules, "openai", types.SimpleNamespace(OpenAI=_FakeOpenAI))
+    monkeypatch.setattr(tts_service, "_OPENAI_CLIENTS", {})
+    svc = tts_service.OpenAITTSService(default_lang="en")
+    threads = [threading.Thread(target=svc._get_client, args=("test-key",)) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert built == ["test-key"]
+
+
+@pytest.mark.skipif(sys.version_info >= (3, 13), reason="Coqui not supported on Python 3.13+")
+def test_coqui_model_loaded_once(tmp_path, monkeypatch):
+    """Coqui models load once and are reused across services and for file output."""
+    loads = []
+    written = []
+
+    class _FakeTTS:
+        def __init__(self, model_name):
+            loads.append(model_name)
+            self.synthesizer = types.SimpleNamespace(output_sample_rate=16000)
+
+        def to(self, device):
+            return self
+
+        def tts(self, text):
+            return [0.0, 0.25, -0.5]
+
+        def tts_to_file(self, text, file_path):
+            written.append(file_path)
+            Path(file_path).write_bytes(b"RIFFcoqui")
+
+    api = types.ModuleType("TTS.api")
+    api.TTS = _FakeTTS
+    pkg = types.ModuleType("TTS")
+    pkg.api = api
+    monkeypatch.setitem(sys.modules, "TTS", pkg)
+    monkeypatch.setitem(sys.modules, "TTS.api", api)
+    monkeypatch.setattr(tts_service, "_COQUI_MODELS", {})
+
+    for _ in range(3):
+        svc = tts_service.CoquiTTSService(default_lang="en")
+        audio, sr = svc.synthesize("Hello", language="en")
+
+    assert loads == ["tts_models/en/ljspeech/tacotron2-DDC"]
+    assert sr == 16000 and audio.dtype == np.float32
+
+    out = svc.synthesize_to_path("Hello", tmp_path / "coqui.wav")
+    assert out.read_bytes() == b"RIFFcoqui"
+    assert written[0] != str(out) and not Path(written[0]).exists()  # written via a temp file
+
+
+def test_long_text_split_into_ordered_sentences():
+    """With workers, long text is synthesized per sentence and joined in input order."""
+    seen = []
+    lock = threading.Lock()
+
+    def _one(chunk):
+        with lock:
+            seen.append(chunk)
+        index = float(chunk.split()[1])
+        return np.full(2, index, dtype=np.float32), 24000
+
+    text = " ".join(f"Sentence {i} is long enough to pad the text out a bit." for i in range(8))
+    audio, sr = tts_service._synthesize_sentences(_one, text, max_workers=4)
+
+    assert sr == 24000 and len(seen) == 8
+    assert audio.tolist() == [float(i) for i in range(8) for _ in range(2)]
+
+    # Short text goes through a single call
+    audio, _ = tts_service._synthesize_sentences(_one, "Sentence 9. Short.", max_workers=4)
+    assert audio.tolist() == [9.0, 9.0]
+
+    # The default single worker sends long text as one request
+    seen.clear()
+    audio, _ = tts_service._synthesize_sentences(_one, text)
+    assert seen == [text] and audio.tolist() == [0.0, 0.0]
+
+
+_NUMBERED_TEXT = " ".join(f"Sentence {i} is long enough to pad the text out a bit." for i in range(8))
+
+
+def _sentence_index(text):
+    return int(text.split()[1])
+
+
+def test_gtts_service_splits_long_text_with_workers(fake_gtts, monkeypatch):
+    """get_tts(max_workers>1) makes gTTS request each sentence and keep their order."""
+    monkeypatch.setattr(
+        tts_service,
+        "_decode_mp3",
+        lambda data: (np.full(2, _sentence_index(data[3:].decode()) / 10, dtype=np.float32), 24000),
+    )
+
+    audio, sr = get_tts("gtts", "en", max_workers=4).synthesize(_NUMBERED_TEXT, language="en")
+    assert sorted(_sentence_index(text) for text, _ in fake_gtts.requests) == list(range(8))
+    assert sr == 24000 and np.allclose(audio, [i / 10 for i in range(8) for _ in range(2)])
+
+    # The default sends the whole text at once
+    fake_gtts.requests.clear()
+    tts_service._GTTS_AUDIO_CACHE.clear()
+    get_tts("gtts", "en").synthesize(_NUMBERED_TEXT, language="en")
+    assert fake_gtts.requests == [(_NUMBERED_TEXT, "en")]
+
+
+def test_openai_service_splits_long_text_with_workers(fake_openai):
+    """get_tts(max_workers>1) makes OpenAI request each sentence and keep their order."""
+    fake_openai.respond = lambda text: np.full(2, _sentence_index(text), dtype="<i2").tobytes()
+
+    audio, sr = get_tts("openai", "en", max_workers=4).synthesize(_NUMBERED_TEXT, language="en")
+    assert len(fake_openai.requests) == 8
+    assert sr == 24000
+    assert np.allclose(audio * 32768, [i for i in range(8) for _ in range(2)])
+
+
+def test_get_tts_accepts_enum_and_any_case():
+    """get_tts resolves TTSEngine members and case-insensitive codes."""
+    assert isinstance(get_tts(TTSEngine.GTTS), tts_service.GttsTTSService)
+    assert isinstance(get_tts(engine="GTTS"), tts_service.GttsTTSService)
+    with pytest.raises(ValueError, match="Unknown engine"):
+        get_tts(engine="nope")
+
+
+def test_gtts_synthesize_to_path_writes_mp3(fake_gtts, tmp_path):
+    """gTTS MP3 output goes to disk without decoding."""
+    svc = tts_service.GttsTTSService(default_lang="en")
+
+    out = svc.synthesize_to_path("Hello", tmp_path / "out" / "hello.mp3")
+    assert out.read_bytes() == b"ID3Hello"
+    # Same permissions as a file created with a plain open() (umask-derived)
+    reference = tmp_path / "out" / "reference.bin"
+    reference.write_bytes(b"")
+    assert stat.S_IMODE(out.stat().st_mode) == stat.S_IMODE(reference.stat().st_mode)
+    reference.unlink()
+    with pytest.raises(ValueError, match="MP3 only"):
+        svc.synthesize_to_path("Hello", tmp_path / "hello.wav")
+
+    # A request failing mid-write leaves neither a partial file nor a temp file
+    fake_gtts.error = ConnectionError("offline")
+    with pytest.raises(RuntimeError, match="internet connection"):
+        svc.synthesize_to_path("Hello", tmp_path / "failed.mp3")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["out"]
+
+
+def test_openai_synthesize_to_path_streams_container(fake_openai, tmp_path):
+    """OpenAI output streams into the file only once the response completes."""
+    fake_openai.respond = lambda text: b"RIFFfake-wav"
+    fake_openai.fail_inputs.add("fail")
+    svc = tts_service.OpenAITTSService(default_lang="en")
+
+    out = svc.synthesize_to_path("Hello", tmp_path / "hello.wav")
+    assert out.read_bytes() == b"RIFFfake-wav"
+    assert fake_openai.requests[-1]["response_format"] == "wav"
+
+    with pytest.raises(RuntimeError, match="network connectivity"):
+        svc.synthesize_to_path("fail", tmp_path / "hello.wav")
+    assert out.read_bytes() == b"RIFFfake-wav"  # previous file untouched
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["hello.wav"]
+
+    with pytest.raises(ValueError, match="Unsupported output format"):
+        svc.synthesize_to_path("Hello", tmp_path / "hello.ogg")
+
+
+def test_get_tts_services_are_independent(monkeypatch):
+    """get_tts hands out separate services that share the expensive caches."""
+    calls = []
+
+    def _one(self, text, lang):
+        calls.append(text)
+        return np.zeros(4, dtype=np.float32), 24000
+
+    monkeypatch.setattr(tts_service, "_GTTS_AUDIO_CACHE", OrderedDict())
+    monkeypatch.setattr(tts_service.GttsTTSService, "_synthesize_one", _one)
+
+    first = get_tts(engine="gtts", default_lang="en")
+    first.set_language("tr")
+    second = get_tts(TTSEngine.GTTS, default_lang="en")
+    assert second is not first and second._default_lang == "en"
+
+    first.synthesize("Hello", language="en")
+    second.synthesize("Hello", language="en")
+    assert calls == ["Hello"]
+
+    get_tts.cache_clear()
+    assert not tts_service._GTTS_AUDIO_CACHE
+
 
+def test_is_available_checks_without_importing(monkeypatch):
+    """Availability probes honour the API key and reject unknown engines."""
+    packages = ("gtts", "openai", "TTS")
+    for name in packages:
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    for engine in ("gtts", "openai", "coqui"):
+        is_available(engine)
+    assert not any(name in sys.modules for name in packages)
 
+    monkeypatch.delenv("OPENAI_API_KEY")
+    assert is_available(TTSEngine.OPENAI) is False
+    assert is_available("gTTS") is is_available("gtts")
+    with pytest.raises(ValueError, match="Unknown engine"):
+        is_available("espeak")
@@ -7,30 +7,31 @@ from src.app import _map_ui_engine_to_code, _map_ui_language_to_code
 
 
 @pytest.mark.smoke
-def test_streamlit_app_imports():
+def test_streamlit_app_imports(_warm_app):
     """Test that the Streamlit app can be imported without errors."""
-    import src.app  # noqa: F401
-    assert True
+    assert _warm_app is not None
 
 
-def test_engine_map():
-    """Test engine label to code mapping."""
-    assert _map_ui_engine_to_code("gTTS (default)") == "gtts"
-    assert _map_ui_engine_to_code("OpenAI (API)") == "openai"
-    assert _map_ui_engine_to_code("Coqui (local)") == "coqui"
-    
-    # Test fallback
-    assert _map_ui_engine_to_code("unknown") == "gtts"
+@pytest.mark.parametrize(
+    "mapper, label, expected",
+    [
+        (_map_ui_engine_to_code, "gTTS (default)", "gtts"),
+        (_map_ui_engine_to_code, "OpenAI (API)", "openai"),
+        (_map_ui_engine_to_code, "Coqui (local)", "coqui"),
+        (_map_ui_engine_to_code, "unknown", "gtts"),  # fallback
+        (_map_ui_language_to_code, "English (US)", "en"),
+        (_map_ui_language_to_code, "English (UK)", "en"),
+        (_map_ui_language_to_code, "Turkish", "tr"),
+        (_map_ui_language_to_code, "unknown", "en"),  # fallback
+    ],
+)
+def test_label_maps(mapper, label, expected):
+    """Test engine and language label to code mapping."""
+    assert mapper(label) == expected
 
 
-def test_lang_map():
-    """Test language label to code mapping."""
-    assert _map_ui_language_to_code("English (US)") == "en"
-    assert _map_ui_language_to_code("English (UK)") == "en"
-    assert _map_ui_language_to_code("Turkish") == "tr"
-    
-    # Test fallback
-    assert _map_ui_language_to_code("unknown") == "en"
+_ENGINE_CODES = frozenset({"gtts", "openai", "coqui"})
+_LANG_CODES = frozenset({"en", "tr"})
 
 
 def test_mapping_consistency():
@@ -39,10 +40,5 @@ def test_mapping_consistency():
     ui_engines = ["gTTS (default)", "OpenAI (API)", "Coqui (local)"]
     ui_languages = ["English (US)", "English (UK)", "Turkish"]
     
-    for engine in ui_engines:
-        code = _map_ui_engine_to_code(engine)
-        assert code in ["gtts", "openai", "coqui"]
-    
-    for lang in ui_languages:
-        code = _map_ui_language_to_code(lang)
-        assert code in ["en", "tr"]
+    assert frozenset(map(_map_ui_engine_to_code, ui_engines)) <= _ENGINE_CODES
+    assert frozenset(map(_map_ui_language_to_code, ui_languages)) <= _LANG_CODES